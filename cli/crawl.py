@@ -12,6 +12,10 @@ from urllib.parse import urlsplit
 from datetime import datetime
 from core.config import DATA_DIR
 
+# Scheduler queue used before SCHEDULER_PRIORITY_QUEUE became
+# DownloaderAwarePriorityQueue; checkpoints it wrote must resume with it.
+_LEGACY_PRIORITY_QUEUE = "scrapy.pqueues.ScrapyPriorityQueue"
+
 
 def _crawl_stats(jsonl_path):
     """(downloaded, with_content, content_eligible) for a crawl jsonl.
@@ -114,6 +118,22 @@ def _latest_crawl_file(project, spider):
     return files[0] if files else None
 
 
+def _legacy_queue_checkpoint(checkpoint_dir):
+    """True if the checkpoint's queue state was written by ScrapyPriorityQueue.
+
+    That queue saves a list of priorities; DownloaderAwarePriorityQueue saves a
+    dict per download slot and raises ValueError when handed the list, so the
+    paused crawl could never resume.
+    """
+    state_path = Path(checkpoint_dir) / "requests.queue" / "active.json"
+    try:
+        with open(state_path, "r") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(state, list) and bool(state)
+
+
 def _build_detached_cmd(
     scrapai_path,
     spider,
@@ -625,6 +645,13 @@ def _run_spider(
                 click.echo(f"⚠️  Could not read checkpoint state: {e}")
                 click.echo("   Continuing with existing checkpoint")
 
+        if _legacy_queue_checkpoint(checkpoint_dir):
+            click.echo(
+                "⚠️  Checkpoint was saved by the previous scheduler queue - "
+                "resuming it with ScrapyPriorityQueue"
+            )
+            cmd.extend(["-s", f"SCHEDULER_PRIORITY_QUEUE={_LEGACY_PRIORITY_QUEUE}"])
+
         cmd.extend(["-s", f"JOBDIR={checkpoint_dir}"])
         click.echo(f"💾 Checkpoint enabled: {checkpoint_dir}")
         click.echo("   Press Ctrl+C to pause, run same command to resume")
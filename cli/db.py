@@ -446,7 +446,7 @@ def transfer(source_url, skip_items):
     whatever DATABASE_URL is currently set in .env.
     """
     from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.orm import selectinload, sessionmaker
     from core.db import SessionLocal, Base, DATABASE_URL
     from core.models import Spider, SpiderRule, SpiderSetting, ScrapedItem, CrawlQueue
 
@@ -469,8 +469,13 @@ def transfer(source_url, skip_items):
     target = SessionLocal()
 
     try:
-        # Transfer spiders with rules and settings
-        spiders = source.query(Spider).all()
+        # Transfer spiders with rules and settings. Both collections are
+        # loaded up front (one SELECT each) instead of lazily per spider.
+        spiders = (
+            source.query(Spider)
+            .options(selectinload(Spider.rules), selectinload(Spider.settings))
+            .all()
+        )
         click.echo(f"\n🕷️  Transferring {len(spiders)} spiders...")
 
         spider_id_map = {}
@@ -12,9 +12,23 @@ project_root = Path(__file__).parent.parent
 dotenv_path = project_root / ".env"
 load_dotenv(dotenv_path)
 
+
+def _env_int(name, default=0):
+    """Integer env setting; unset, empty or non-integer values give `default`
+    rather than failing at import."""
+    try:
+        return int(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
 DATA_DIR = os.getenv("DATA_DIR", "./data")
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "info")
 LOG_DIR = os.getenv("LOG_DIR", "./logs")
 
+# Worker processes for newspaper/trafilatura extraction. 0 (default) keeps
+# extraction on threads; >0 spreads CPU-bound parsing across that many cores.
+EXTRACT_PROCESSES = _env_int("EXTRACT_PROCESSES")
+
 Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
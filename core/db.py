@@ -11,7 +11,21 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     DATABASE_URL = "sqlite:///scrapai.db"
 
-engine = create_engine(DATABASE_URL)
+
+def _engine_options():
+    """Pool options for the shared engine.
+
+    DatabasePipeline holds one session for the whole crawl, so pooled
+    connections are pinged before reuse and recycled hourly — a long idle
+    stretch (a slow site, a paused queue worker) must not hand the next flush
+    a connection the server already dropped. No driver-specific executemany
+    options: on psycopg2, SQLAlchemy 2.x already sends the flush's INSERTs as
+    paged multi-row VALUES by default, and the flush issues no UPDATEs.
+    """
+    return {"pool_pre_ping": True, "pool_recycle": 3600}
+
+
+engine = create_engine(DATABASE_URL, **_engine_options())
 
 
 @event.listens_for(engine, "connect")
@@ -1,18 +1,38 @@
+import atexit
+import functools
 import logging
 import asyncio
+import multiprocessing
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional, List, Dict
 
 import extruct
 import newspaper
 import trafilatura
 from bs4 import BeautifulSoup
+from cssselect import SelectorError
 from dateutil import parser as _du_parser
+from lxml import etree
 from markdownify import markdownify as _md
+from parsel import Selector
+from parsel.csstranslator import css2xpath
 from .schemas import ScrapedArticle
 
 logger = logging.getLogger(__name__)
 
+# Tags whose text BeautifulSoup's get_text() leaves out of an element's text
+# (script/style/template bodies, ruby annotations). CustomExtractor mirrors
+# that on the lxml tree so selector results read the same as before.
+_NON_TEXT_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+_VISIBLE_TEXT = etree.XPath(
+    ".//text()[not(%s)]"
+    % " or ".join(f"ancestor::{tag}" for tag in sorted(_NON_TEXT_TAGS)),
+    smart_strings=False,
+)
+_ALL_TEXT = etree.XPath(".//text()", smart_strings=False)
+
 
 def _find_key(obj, key):
     """First value for `key` anywhere in a nested structured-data object."""
@@ -162,8 +182,11 @@ class NewspaperExtractor(BaseExtractor):
         self, url: str, html: str, title_hint: str = None, include_html: bool = False
     ) -> Optional[ScrapedArticle]:
         try:
-            # newspaper4k usually fetches itself, but we can pass html
-            article = newspaper.Article(url)
+            # newspaper4k usually fetches itself, but we can pass html.
+            # fetch_images=False: otherwise parse() downloads candidate images
+            # (outside Scrapy, unproxied, on the worker thread) just to size-check
+            # them for top_image; we take the og:image meta tag instead.
+            article = newspaper.Article(url, fetch_images=False)
             article.download(input_html=html)
             article.parse()
 
@@ -307,6 +330,13 @@ class CustomExtractor(BaseExtractor):
                       e.g., {"title": "h1.title", "content": "div.article"}
         """
         self.selectors = selectors
+        # CSS -> compiled XPath once per extractor, not once per page. None
+        # marks selectors lxml can't run; those go through BeautifulSoup.
+        self._xpaths = {
+            sel: _compile_css(sel)
+            for sel in (selectors or {}).values()
+            if isinstance(sel, str)
+        }
 
     def extract(
         self, url: str, html: str, title_hint: str = None, include_html: bool = False
@@ -318,36 +348,44 @@ class CustomExtractor(BaseExtractor):
         Custom fields: anything else goes into metadata
         """
         try:
-            soup = BeautifulSoup(html, "lxml")
+            page = _ParsedPage(html)
 
             # Extract standard fields
-            title = self._extract_text(soup, self.selectors.get("title"))
+            title = self._extract_text(page, self.selectors.get("title"))
             logger.debug(
-                f"Extracted title: '{title}' using selector '{self.selectors.get('title')}'"
+                "Extracted title: '%s' using selector '%s'",
+                title,
+                self.selectors.get("title"),
             )
             if not title and title_hint:
                 title = title_hint.strip()
-                logger.debug(f"Using title hint: '{title}'")
+                logger.debug("Using title hint: '%s'", title)
 
-            author = self._extract_text(soup, self.selectors.get("author"))
+            author = self._extract_text(page, self.selectors.get("author"))
             logger.debug(
-                f"Extracted author: '{author}' using selector '{self.selectors.get('author')}'"
+                "Extracted author: '%s' using selector '%s'",
+                author,
+                self.selectors.get("author"),
             )
             # No explicit author selector match -> structured metadata fallback.
             if not author:
                 author = extract_meta_author(html)
 
-            content = self._extract_text(soup, self.selectors.get("content"))
+            content = self._extract_text(page, self.selectors.get("content"))
             content_len = len(content) if content else 0
             logger.debug(
-                f"Extracted content: {content_len} chars using selector '{self.selectors.get('content')}'"
+                "Extracted content: %d chars using selector '%s'",
+                content_len,
+                self.selectors.get("content"),
             )
             if content and content_len < 200:
-                logger.debug(f"Content preview: '{content[:200]}'")
+                logger.debug("Content preview: '%s'", content)
 
-            date_str = self._extract_text(soup, self.selectors.get("date"))
+            date_str = self._extract_text(page, self.selectors.get("date"))
             logger.debug(
-                f"Extracted date: '{date_str}' using selector '{self.selectors.get('date')}'"
+                "Extracted date: '%s' using selector '%s'",
+                date_str,
+                self.selectors.get("date"),
             )
 
             # Validation: at minimum need title and content
@@ -382,7 +420,7 @@ class CustomExtractor(BaseExtractor):
                     continue
 
                 # Extract custom field
-                value = self._extract_text(soup, selector)
+                value = self._extract_text(page, selector)
                 if value:
                     metadata[field_name] = value
 
@@ -402,13 +440,13 @@ class CustomExtractor(BaseExtractor):
             return None
 
     def _extract_text(
-        self, soup: BeautifulSoup, selector: Optional[str]
+        self, page: "_ParsedPage", selector: Optional[str]
     ) -> Optional[str]:
         """
         Extract text from HTML using CSS selector.
 
         Args:
-            soup: BeautifulSoup object
+            page: The parsed page
             selector: CSS selector string
 
         Returns:
@@ -418,19 +456,145 @@ class CustomExtractor(BaseExtractor):
             return None
 
         try:
-            # Find element
-            element = soup.select_one(selector)
-            if not element:
-                logger.debug(f"Selector '{selector}' found no elements")
-                return None
-
-            # Get text and clean it
-            text = element.get_text(separator=" ", strip=True)
+            xpath = self._xpaths.get(selector)
+            if xpath is None:
+                # Syntax cssselect can't translate but soupsieve supports
+                # (e.g. :-soup-contains): keep those configs working.
+                element = page.soup.select_one(selector)
+                if not element:
+                    logger.debug("Selector '%s' found no elements", selector)
+                    return None
+                text = element.get_text(separator=" ", strip=True)
+            else:
+                elements = xpath(page.root)
+                if not elements:
+                    logger.debug("Selector '%s' found no elements", selector)
+                    return None
+                text = _element_text(elements[0])
             return text if text else None
 
         except Exception as e:
-            logger.debug(f"Error extracting with selector '{selector}': {e}")
+            logger.debug("Error extracting with selector '%s': %s", selector, e)
+            return None
+
+
+class _ParsedPage:
+    """A page parsed once into an lxml tree (via parsel).
+
+    BeautifulSoup is only built if a selector needs soupsieve-only syntax.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+        self.root = Selector(text=html).root
+        self._soup = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_css(selector: str) -> Optional[etree.XPath]:
+    """Compiled XPath for a CSS selector (parsel dialect, so ``::text`` and
+    ``::attr(...)`` work), or None if cssselect/lxml can't handle it."""
+    try:
+        return etree.XPath(css2xpath(selector), smart_strings=False)
+    except (SelectorError, etree.XPathError):
+        return None
+
+
+def _element_text(node) -> str:
+    """Text of one matched node, as get_text(separator=" ", strip=True) gives it.
+
+    Stripped, non-empty text nodes joined by single spaces. Text-node and
+    attribute matches (``::text``, ``::attr(...)``) are returned stripped.
+    """
+    if isinstance(node, str):
+        return node.strip()
+    texts = _ALL_TEXT(node) if node.tag in _NON_TEXT_TAGS else _VISIBLE_TEXT(node)
+    return " ".join(t for t in (s.strip() for s in texts) if t)
+
+
+# Extractors cheap to hand to a worker process: pure functions of (url, html).
+_CPU_EXTRACTORS = {
+    "newspaper": NewspaperExtractor,
+    "trafilatura": TrafilaturaExtractor,
+}
+
+_process_pool = None
+
+
+def _get_process_pool():
+    """Shared ProcessPoolExecutor when EXTRACT_PROCESSES > 0, else None.
+
+    Created on first use so crawls that keep the thread default never start
+    workers. Uses spawn: forking a process that already runs the reactor and
+    its thread pool can deadlock the child. The pool is process-wide (every
+    spider in the process shares it), so it is shut down once, at exit.
+    """
+    global _process_pool
+    if _process_pool is None:
+        from .config import EXTRACT_PROCESSES
+
+        if EXTRACT_PROCESSES <= 0:
             return None
+        _process_pool = ProcessPoolExecutor(
+            max_workers=EXTRACT_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """Stop the extraction workers, if any; the next use starts a fresh pool.
+
+    Doesn't wait for running extractions and drops queued ones, so it never
+    blocks the caller.
+    """
+    global _process_pool
+    pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _extract_in_worker(strategy, url, html, title_hint, include_html):
+    """Worker-process entry point; returns a picklable ScrapedArticle or None."""
+    return _CPU_EXTRACTORS[strategy]().extract(url, html, title_hint, include_html)
+
+
+async def _run_cpu_extractor(strategy, url, html, title_hint, include_html):
+    """Run a newspaper/trafilatura extraction off the event loop.
+
+    Threads by default; a process pool when EXTRACT_PROCESSES is set, so
+    parsing scales past one core instead of contending for the GIL.
+    """
+    global _process_pool
+    pool = _get_process_pool()
+    if pool is not None:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                pool, _extract_in_worker, strategy, url, html, title_hint, include_html
+            )
+        except BrokenProcessPool:
+            # A worker died (OOM on a huge page, a crash in lxml): the pool
+            # refuses all further work, so drop it and start a new one on
+            # the next page. This page is retried on a thread.
+            logger.warning(
+                "Extraction worker died on %s; restarting the process pool", url
+            )
+            if _process_pool is pool:
+                _process_pool = None
+            pool.shutdown(wait=False)
+    return await asyncio.to_thread(
+        _CPU_EXTRACTORS[strategy]().extract, url, html, title_hint, include_html
+    )
 
 
 class SmartExtractor:
@@ -448,6 +612,9 @@ class SmartExtractor:
     ):
         self.strategies = strategies or ["trafilatura", "newspaper"]
         self.custom_selectors = custom_selectors
+        self._custom_extractor = (
+            CustomExtractor(custom_selectors) if custom_selectors else None
+        )
 
     async def extract(
         self,
@@ -481,18 +648,18 @@ class SmartExtractor:
         # Try each strategy in order
         for strategy in self.strategies:
             if strategy == "custom":
-                if self.custom_selectors:
-                    logger.info(f"Trying custom extractor for {url}")
+                if self._custom_extractor:
+                    logger.debug("Trying custom extractor for %s", url)
                     try:
                         result = await asyncio.to_thread(
-                            CustomExtractor(self.custom_selectors).extract,
+                            self._custom_extractor.extract,
                             url,
                             html,
                             title_hint,
                             include_html,
                         )
                         if result:
-                            logger.info(f"Successfully extracted {url} using custom")
+                            logger.debug("Successfully extracted %s using custom", url)
                             return result
                         else:
                             logger.debug(
@@ -506,17 +673,13 @@ class SmartExtractor:
                     )
 
             elif strategy == "newspaper":
-                logger.info(f"Trying newspaper extractor for {url}")
+                logger.debug("Trying newspaper extractor for %s", url)
                 try:
-                    result = await asyncio.to_thread(
-                        NewspaperExtractor().extract,
-                        url,
-                        html,
-                        title_hint,
-                        include_html,
+                    result = await _run_cpu_extractor(
+                        "newspaper", url, html, title_hint, include_html
                     )
                     if result:
-                        logger.info(f"Successfully extracted {url} using newspaper")
+                        logger.debug("Successfully extracted %s using newspaper", url)
                         return result
                     else:
                         logger.debug(
@@ -526,17 +689,13 @@ class SmartExtractor:
                     logger.debug(f"Newspaper extractor failed for {url}: {e}")
 
             elif strategy == "trafilatura":
-                logger.info(f"Trying trafilatura extractor for {url}")
+                logger.debug("Trying trafilatura extractor for %s", url)
                 try:
-                    result = await asyncio.to_thread(
-                        TrafilaturaExtractor().extract,
-                        url,
-                        html,
-                        title_hint,
-                        include_html,
+                    result = await _run_cpu_extractor(
+                        "trafilatura", url, html, title_hint, include_html
                     )
                     if result:
-                        logger.info(f"Successfully extracted {url} using trafilatura")
+                        logger.debug("Successfully extracted %s using trafilatura", url)
                         return result
                     else:
                         logger.debug(
@@ -546,7 +705,7 @@ class SmartExtractor:
                     logger.debug(f"Trafilatura extractor failed for {url}: {e}")
 
             elif strategy == "playwright":
-                logger.info(f"Trying playwright extractor for {url}")
+                logger.debug("Trying playwright extractor for %s", url)
                 try:
                     result = await self._extract_with_playwright_async(
                         url,
@@ -559,7 +718,7 @@ class SmartExtractor:
                         scroll_delay,
                     )
                     if result:
-                        logger.info(f"Successfully extracted {url} using playwright")
+                        logger.debug("Successfully extracted %s using playwright", url)
                         return result
                     else:
                         logger.debug(
@@ -21,6 +21,34 @@ def _utcnow():
     return datetime.now(timezone.utc)
 
 
+# Legacy stringified booleans (any case). JSON covers the lowercase forms.
+_LEGACY_LITERALS = {"true": True, "false": False}
+
+# First non-space character of any JSON document: object, array, string,
+# number, true/false/null (plus the NaN/Infinity extensions Python's json
+# accepts). Values starting with anything else are plain strings, so
+# json.loads (and the exception it would raise) is skipped.
+_JSON_START = frozenset('{["-0123456789tfnNI')
+
+
+def _decode_setting_value(val: Any) -> Any:
+    """Decode one stored setting value (see deserialize_spider_settings)."""
+    if not isinstance(val, str):
+        return val
+    stripped = val.lstrip()
+    if stripped and stripped[0] in _JSON_START:
+        try:
+            return json.loads(stripped)
+        except json.JSONDecodeError:
+            pass
+    coerced = _LEGACY_LITERALS.get(val.lower())
+    if coerced is not None:
+        return coerced
+    if val.isdigit():
+        return int(val)
+    return val
+
+
 def deserialize_spider_settings(settings_rows: Iterable) -> Dict[str, Any]:
     """Convert SpiderSetting rows into a settings dict.
 
@@ -28,21 +56,7 @@ def deserialize_spider_settings(settings_rows: Iterable) -> Dict[str, Any]:
     covers dicts, lists, true/false/null literals, and numbers); failing that,
     we honor a legacy convention of stringified booleans and integers.
     """
-    result: Dict[str, Any] = {}
-    for s in settings_rows:
-        val = s.value
-        try:
-            val = json.loads(val)
-        except (json.JSONDecodeError, TypeError):
-            if isinstance(val, str):
-                if val.lower() == "true":
-                    val = True
-                elif val.lower() == "false":
-                    val = False
-                elif val.isdigit():
-                    val = int(val)
-        result[s.key] = val
-    return result
+    return {s.key: _decode_setting_value(s.value) for s in settings_rows}
 
 
 class Spider(Base):
@@ -62,8 +76,13 @@ class Spider(Base):
     created_at = Column(DateTime, default=_utcnow)
     updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow)
 
+    # Highest priority first (id breaks ties), so spiders can compile rules in
+    # the order they're loaded.
     rules = relationship(
-        "SpiderRule", back_populates="spider", cascade="all, delete-orphan"
+        "SpiderRule",
+        back_populates="spider",
+        cascade="all, delete-orphan",
+        order_by="(SpiderRule.priority.desc(), SpiderRule.id)",
     )
     settings = relationship(
         "SpiderSetting", back_populates="spider", cascade="all, delete-orphan"
@@ -1 +1 @@
-"""Scrapy download handlers."""
+"""Scrapy download handlers and HTTP cache storage."""
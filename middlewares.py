@@ -5,14 +5,15 @@ Scrapy middlewares for proxy support and enhanced downloading
 
 import logging
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
 from scrapy import signals, Request
 from scrapy_deltafetch import DeltaFetch
-from dotenv import load_dotenv
 from urllib.parse import urlparse
 
 from core import proxy
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
 
@@ -36,25 +37,9 @@ class SmartProxyMiddleware:
         # Determine proxy type (auto, datacenter, or residential)
         self.proxy_mode = settings.get("PROXY_TYPE", "auto") if settings else "auto"
 
-        # All proxy URLs come from core.proxy — the single, env-driven source.
-        self.datacenter_configured = proxy.datacenter_url() is not None
-        self.residential_configured = proxy.residential_url() is not None
-        self.proxy_url, self.active_proxy_type = proxy.select(self.proxy_mode)
-        self.proxy_available = self.proxy_url is not None
-
-        if self.proxy_available:
-            logger.info(
-                f"✅ Proxy active: {self.active_proxy_type} (mode={self.proxy_mode}). "
-                "Strategy: Direct → proxy on block."
-            )
-            if self.proxy_mode == "auto" and self.residential_configured:
-                logger.info(
-                    "💡 Residential proxy detected (will prompt if datacenter fails)"
-                )
-        else:
-            logger.warning(
-                f"⚠️  No proxy active (mode={self.proxy_mode}) — direct connections only"
-            )
+        # Proxy URLs (from core.proxy — the single, env-driven source) are
+        # resolved lazily: most crawls never hit a block, so the env lookups
+        # and status logging wait until a request actually needs a proxy.
 
         # Track domains that require proxy (learned from 403/429/503 errors)
         self.blocked_domains = set()
@@ -73,6 +58,54 @@ class SmartProxyMiddleware:
             "blocked_retries": 0,
         }
 
+    @cached_property
+    def _proxy_selection(self):
+        """(proxy_url, active_proxy_type), resolved on first use."""
+        proxy_url, active_proxy_type = proxy.select(self.proxy_mode)
+        if proxy_url:
+            logger.info(
+                f"✅ Proxy active: {active_proxy_type} (mode={self.proxy_mode}). "
+                "Strategy: Direct → proxy on block."
+            )
+            if self.proxy_mode == "auto" and self.residential_configured:
+                logger.info(
+                    "💡 Residential proxy detected (will prompt if datacenter fails)"
+                )
+        else:
+            logger.warning(
+                f"⚠️  No proxy active (mode={self.proxy_mode}) — direct connections only"
+            )
+        return proxy_url, active_proxy_type
+
+    @property
+    def proxy_url(self):
+        return self._proxy_selection[0]
+
+    @property
+    def active_proxy_type(self):
+        return self._proxy_selection[1]
+
+    @property
+    def proxy_available(self):
+        return self.proxy_url is not None
+
+    @cached_property
+    def datacenter_configured(self):
+        return proxy.datacenter_url() is not None
+
+    @cached_property
+    def residential_configured(self):
+        return proxy.residential_url() is not None
+
+    @cached_property
+    def proxy_configured(self):
+        """Whether proxy_mode has a proxy in the env, without selecting it."""
+        if self.proxy_mode == "none":
+            return False
+        if self.proxy_mode == "auto":
+            return self.datacenter_configured or self.residential_configured
+        return proxy.url_for(self.proxy_mode) is not None
+
     @classmethod
     def from_crawler(cls, crawler):
         middleware = cls(settings=crawler.settings, crawler=crawler)
@@ -109,7 +142,7 @@ class SmartProxyMiddleware:
             if not request.meta.get("proxy"):
                 request.meta["proxy"] = self.proxy_url
                 self.stats["proxy_requests"] += 1
-                logger.debug(f"🔒 Using proxy for known-blocked domain: {domain}")
+                logger.debug("🔒 Using proxy for known-blocked domain: %s", domain)
         else:
             # Direct connection (no proxy)
             self.stats["direct_requests"] += 1
@@ -208,7 +241,10 @@ class SmartProxyMiddleware:
             spider.state = {}
         spider.state["proxy_type_used"] = self.proxy_mode
 
-        if self.proxy_available:
+        # Only check that a proxy exists here; selecting it (and its status
+        # logging) waits for the first block, or the first request when
+        # proxying from the start.
+        if self.proxy_configured:
             logger.info(
                 f"🕷️  Spider '{spider.name}' started - Smart proxy mode enabled"
             )
@@ -248,6 +284,109 @@ class SmartProxyMiddleware:
             self._show_expert_message()
 
 
+def _parse_retry_after(value):
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("latin-1", "ignore")
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimitBackoffMiddleware:
+    """
+    Back off a domain's download slot when the server answers 429.
+
+    AutoThrottle only adapts to latency and never slows down on an error page
+    (a fast 429 would otherwise *shrink* the delay), so under a rate-limit storm
+    the crawl keeps hitting the origin at the same pace. This middleware raises
+    the slot delay instead: it doubles on each 429, honours Retry-After when the
+    server sends one, and is capped at RATELIMIT_MAX_DELAY (default 60s).
+
+    The raised delay is held until a per-slot "not before" deadline (one backoff
+    interval after the 429). AutoThrottle re-computes the delay on every
+    response and clamps it to AUTOTHROTTLE_MAX_DELAY, so the held delay is
+    re-applied after each response until then. Past the deadline it halves on
+    each 200, at most once per interval, until it is back at DOWNLOAD_DELAY;
+    AutoThrottle's own delay wins whenever it is higher.
+
+    It only adjusts pacing and passes the response on unchanged — retrying the
+    429 stays with RetryMiddleware / SmartProxyMiddleware.
+    """
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        settings = crawler.settings
+        self.min_delay = settings.getfloat("DOWNLOAD_DELAY", 0)
+        self.start_delay = settings.getfloat("AUTOTHROTTLE_START_DELAY", 1) or 1.0
+        self.max_delay = settings.getfloat("RATELIMIT_MAX_DELAY", 60)
+        self.autothrottle = settings.getbool("AUTOTHROTTLE_ENABLED")
+        # Slots this middleware slowed down and hasn't restored yet:
+        # key -> [held delay, monotonic time before which it isn't lowered].
+        self.backed_off = {}
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler)
+
+    def _slot(self, request):
+        key = request.meta.get("download_slot")
+        engine = getattr(self.crawler, "engine", None)
+        if key is None or engine is None:
+            return None, None
+        return key, engine.downloader.slots.get(key)
+
+    def process_response(self, request, response):
+        if response.status == 429:
+            key, slot = self._slot(request)
+            if slot is None:
+                return response
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            held = self.backed_off.get(key, (0,))[0]
+            current = max(slot.delay, held)
+            new_delay = current * 2 if current else self.start_delay
+            if retry_after:
+                new_delay = max(new_delay, retry_after)
+            slot.delay = min(new_delay, self.max_delay)
+            self.backed_off[key] = [slot.delay, time.monotonic() + slot.delay]
+            logger.warning(
+                f"⏳ 429 from {key}: slot delay now {slot.delay:.1f}s "
+                f"(Retry-After: {retry_after if retry_after is not None else 'n/a'})"
+            )
+            if getattr(self.crawler, "stats", None):
+                self.crawler.stats.inc_value("ratelimit/backoff")
+        elif request.meta.get("download_slot") in self.backed_off:
+            key, slot = self._slot(request)
+            if slot is None:
+                return response
+            state = self.backed_off[key]
+            now = time.monotonic()
+            if response.status == 200 and now >= state[1]:
+                state[0] /= 2
+                state[1] = now + state[0]
+                if state[0] <= self.min_delay:
+                    del self.backed_off[key]
+                    if not self.autothrottle:
+                        slot.delay = self.min_delay
+                    return response
+            if self.autothrottle:
+                slot.delay = max(slot.delay, state[0])
+            else:
+                slot.delay = state[0]
+        return response
+
+
 class AsyncDeltaFetch(DeltaFetch):
     """DeltaFetch with async spider-output support for Scrapy 2.16+.
 
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timezone
 from itemadapter import ItemAdapter
 
@@ -17,22 +18,32 @@ def _normalize_dt(dt):
     return dt.astimezone(timezone.utc)
 
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
 def _serialize_datetime_recursive(obj):
     """Recursively convert datetime objects to ISO strings for JSON serialization.
 
-    Handles nested dicts and lists from nested_list extraction.
+    Handles nested dicts and lists from nested_list extraction. Scalars (the
+    vast majority of leaves) are returned on the first check, so large nested
+    items cost one type test per leaf rather than a chain of isinstance calls.
     """
+    if isinstance(obj, _SCALAR_TYPES):
+        return obj
     if isinstance(obj, datetime):
         return obj.isoformat()
-    elif isinstance(obj, dict):
+    if isinstance(obj, dict):
         return {k: _serialize_datetime_recursive(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
+    if isinstance(obj, list):
         return [_serialize_datetime_recursive(item) for item in obj]
-    else:
-        return obj
+    return obj
 
 
 class ScrapaiPipeline:
+    # Second the cached scraped_at prefix belongs to, and that prefix.
+    _stamp_second = None
+    _stamp = None
+
     @classmethod
     def from_crawler(cls, crawler):
         """Create pipeline from crawler (Scrapy convention)."""
@@ -40,11 +51,26 @@ class ScrapaiPipeline:
         pipe.crawler = crawler
         return pipe
 
+    def _scraped_at(self):
+        """Same value as datetime.now().isoformat(), microseconds included.
+
+        Items arrive in bursts; only the microseconds differ between items in
+        the same second, so they are appended to the cached prefix (omitted
+        when zero, as isoformat() does) instead of formatting a datetime per
+        item.
+        """
+        second, ns = divmod(time.time_ns(), 1_000_000_000)
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp = datetime.fromtimestamp(second).isoformat()
+        micros = ns // 1000
+        return f"{self._stamp}.{micros:06d}" if micros else self._stamp
+
     def process_item(self, item):
         adapter = ItemAdapter(item)
 
         # Add scraped timestamp
-        adapter["scraped_at"] = datetime.now().isoformat()
+        adapter["scraped_at"] = self._scraped_at()
 
         # Add source (get spider name from crawler)
         spider_name = (
@@ -95,8 +121,10 @@ class DatabasePipeline:
             return
 
         # 1. Deduplication (Batch Query) — scoped per-spider so the same URL
-        #    can legitimately exist across spiders / projects
-        urls = [i["url"] for i in self.buffer]
+        #    can legitimately exist across spiders / projects. Retries with
+        #    dont_filter can buffer the same URL twice; dedup before the IN
+        #    clause so the SELECT doesn't carry repeated parameters.
+        urls = list({i["url"] for i in self.buffer})
         spider_id = self.buffer[0]["spider_id"]
         try:
             existing_items = (
@@ -137,10 +165,10 @@ class DatabasePipeline:
         seen_in_batch = set()
         for item in self.buffer:
             if item["url"] in existing_urls:
-                spider.logger.debug(f"Item already exists: {item['url']}")
+                spider.logger.debug("Item already exists: %s", item["url"])
                 continue
             if item["url"] in seen_in_batch:
-                spider.logger.debug(f"Duplicate in batch, skipping: {item['url']}")
+                spider.logger.debug("Duplicate in batch, skipping: %s", item["url"])
                 continue
             seen_in_batch.add(item["url"])
 
@@ -151,20 +179,10 @@ class DatabasePipeline:
                     k: v for k, v in item.items() if k not in STANDARD_FIELDS
                 }
 
-                # Convert datetime objects to ISO strings for JSON serialization
-                for key, value in list(custom_fields.items()):
-                    if isinstance(value, datetime):
-                        custom_fields[key] = value.isoformat()
-                    elif isinstance(value, list):
-                        # Handle lists that might contain datetime objects
-                        custom_fields[key] = [
-                            v.isoformat() if isinstance(v, datetime) else v
-                            for v in value
-                        ]
-                    elif isinstance(value, dict):
-                        # Handle nested dicts (from nested_list extraction)
-                        custom_fields[key] = _serialize_datetime_recursive(value)
-
+                # Convert datetime objects to ISO strings for JSON serialization.
+                # One recursive pass covers scalars, lists, and the list-of-dicts
+                # shape nested_list extraction produces.
+                custom_fields = _serialize_datetime_recursive(custom_fields)
                 custom_fields["_callback"] = item["_callback"]
                 metadata = custom_fields
             else:
@@ -2,6 +2,13 @@
 import os
 import logging
 
+from dotenv import load_dotenv
+
+# Load .env once, when Scrapy imports the project settings at crawler startup.
+# Middlewares and handlers read the already-populated environment (proxy URLs
+# via core.proxy) instead of re-parsing the file on every import.
+load_dotenv()
+
 BOT_NAME = "scrapai"
 
 SPIDER_MODULES = ["spiders"]
@@ -10,6 +17,12 @@ NEWSPIDER_MODULE = "spiders"
 # Obey robots.txt rules
 ROBOTSTXT_OBEY = False
 
+# Async callbacks offload newspaper/trafilatura parsing with asyncio.to_thread
+# (core/extractors.py), which needs the asyncio reactor. It is Scrapy's default
+# only from 2.13 on; pin it so older supported Scrapy versions don't fall back
+# to the plain Twisted reactor.
+TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
+
 # High-throughput defaults, kept safe by AutoThrottle. AutoThrottle adapts the
 # delay to each server's response latency, so these high concurrency limits are
 # self-regulating: fast on robust hosts, automatically backing off on fragile or
@@ -24,7 +37,29 @@ CONCURRENT_REQUESTS_PER_DOMAIN = 16
 AUTOTHROTTLE_ENABLED = True
 AUTOTHROTTLE_START_DELAY = 1
 AUTOTHROTTLE_MAX_DELAY = 10
-AUTOTHROTTLE_TARGET_CONCURRENCY = 2.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
+
+# Pick the next request from the domain with the fewest requests in flight
+# instead of the global priority order, so a backlog of URLs for one host can't
+# starve the other domains a spider links out to. Its JOBDIR state is per slot
+# and can't resume a checkpoint written by the old ScrapyPriorityQueue; the crawl
+# CLI pins those resumes to ScrapyPriorityQueue. Spiders that set
+# CONCURRENT_REQUESTS_PER_IP (unsupported by this queue) fall back to it too.
+SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.DownloaderAwarePriorityQueue"
+
+# Fail hung requests after 30s instead of Scrapy's 180s default, so a stalled
+# server can't pin concurrency slots for minutes. Only the built-in HTTP
+# handler enforces this; the Cloudflare/browser and curl_cffi handlers keep
+# their own timeouts (CF_WAIT_TIMEOUT, CURL_CFFI_TIMEOUT).
+DOWNLOAD_TIMEOUT = 30
+
+# Connection reuse: the HTTP/1.1 handler keeps up to CONCURRENT_REQUESTS_PER_DOMAIN
+# persistent (keep-alive) connections per host, so repeat requests to one origin
+# skip the TLS handshake. HTTP/2 is deliberately not enabled: Scrapy's H2 handler
+# rejects proxied requests, which SmartProxyMiddleware relies on. DNS lookups are
+# cached (Scrapy's default resolver) but run on the reactor thread pool; give it
+# room so a crawl across many domains doesn't queue behind 10 threads.
+REACTOR_THREADPOOL_MAXSIZE = 20
 
 # User agent (Chrome 145, Feb 2026)
 USER_AGENT = (
@@ -38,11 +73,17 @@ ITEM_PIPELINES = {
     "pipelines.DatabasePipeline": 400,
 }
 
-# Enable smart proxy middleware (only uses proxy on 403/429 errors)
+# Enable smart proxy middleware (only uses proxy on 403/429 errors).
+# RateLimitBackoffMiddleware sits above RetryMiddleware (550) so it sees every
+# 429 first and slows that domain's slot before the retry is scheduled.
 DOWNLOADER_MIDDLEWARES = {
     "middlewares.SmartProxyMiddleware": 350,
+    "middlewares.RateLimitBackoffMiddleware": 560,
 }
 
+# Ceiling for the 429 backoff (seconds). Retry-After values above it are capped.
+RATELIMIT_MAX_DELAY = 60
+
 # Spider middlewares
 SPIDER_MIDDLEWARES = {
     # AsyncDeltaFetch subclasses scrapy_deltafetch.DeltaFetch to add
@@ -59,9 +100,18 @@ DELTAFETCH_RESET = False
 # Only set when spider has CLOUDFLARE_ENABLED=True in custom_settings
 # This prevents conflicts with normal HTTP requests
 
-# Enable and configure HTTP caching
-HTTPCACHE_ENABLED = False
+# HTTP cache: off for real crawls, opt-in for development so re-running a
+# spider while tuning selectors reads pages from disk instead of re-fetching:
+#   SCRAPAI_HTTPCACHE=1 ./scrapai crawl <spider> --project <name> --limit 5
+# Stored as one SQLite file per spider (.scrapy/httpcache/<spider>.sqlite)
+# rather than Scrapy's file-per-request tree. DummyPolicy caches every response
+# for the expiration window regardless of the site's Cache-Control headers.
+# Error and rate-limit responses are never cached.
+HTTPCACHE_ENABLED = os.environ.get("SCRAPAI_HTTPCACHE", "0") == "1"
 HTTPCACHE_EXPIRATION_SECS = 3600
+HTTPCACHE_DIR = "httpcache"
+HTTPCACHE_STORAGE = "handlers.sqlite_cache_storage.SqliteCacheStorage"
+HTTPCACHE_IGNORE_HTTP_CODES = [301, 302, 403, 404, 429, 500, 502, 503, 504]
 
 # Set log level to INFO to prevent printing full items with HTML to console
 LOG_LEVEL = "INFO"
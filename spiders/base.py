@@ -1,11 +1,23 @@
 """Shared mixin for database-driven spiders."""
 
+import hashlib
 import json
 import logging
 import re
+from collections import OrderedDict
+
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# Bodies remembered per run for duplicate-page skipping. DeltaFetch handles
+# cross-run dedup, so this only needs to cover recent pages within one crawl.
+_SEEN_BODIES_MAX = 200_000
+
+# Same result as response.css("title::text").get(), evaluated straight on the
+# parsed lxml tree: no parsel SelectorList/Selector wrappers per response.
+_TITLE_TEXT = etree.XPath("//title/text()", smart_strings=False)
+
 
 def _apply_meta_fallback(item, html):
     """Fill published_date/author from structured metadata (extruct) when the
@@ -113,6 +125,10 @@ def _pdf_links(response):
 class BaseDBSpiderMixin:
     """Mixin providing shared logic for DatabaseSpider and SitemapDatabaseSpider."""
 
+    # Set per instance by the spiders' __init__ / _apply_cf_to_crawler.
+    _item_limit = None
+    _items_scraped = 0
+
     def _load_settings_from_db(self, spider_record):
         """Deserialize settings from DB spider record into custom_settings."""
         from core.models import deserialize_spider_settings
@@ -189,6 +205,19 @@ class BaseDBSpiderMixin:
                     priority="spider",
                 )
 
+        # DownloaderAwarePriorityQueue refuses to start with per-IP slots.
+        if (
+            crawler.settings.getint("CONCURRENT_REQUESTS_PER_IP")
+            and crawler.settings.get("SCHEDULER_PRIORITY_QUEUE")
+            == "scrapy.pqueues.DownloaderAwarePriorityQueue"
+        ):
+            logger.info("CONCURRENT_REQUESTS_PER_IP is set: using ScrapyPriorityQueue")
+            crawler.settings.set(
+                "SCHEDULER_PRIORITY_QUEUE",
+                "scrapy.pqueues.ScrapyPriorityQueue",
+                priority="cmdline",
+            )
+
         spider._item_limit = crawler.settings.getint("CLOSESPIDER_ITEMCOUNT", 0)
         if spider._item_limit:
             logger.info(f"Item limit set to {spider._item_limit}")
@@ -248,15 +277,52 @@ class BaseDBSpiderMixin:
             "metadata_json": {"content_type": "pdf", "found_on": found_on.url},
         }
 
-    async def _extract_article(self, response, source_label="database_spider"):
-        """Shared article extraction logic."""
-        # PDFs (and similar binaries) aren't HTML: the extractors can't read them
-        # and response.text/.css would raise. We follow .pdf links on purpose
-        # (see database_spider), so collect the URL as a minimal item here.
-        if self._is_pdf_response(response):
-            yield self._build_pdf_item(response, source_label)
-            self._items_scraped += 1
-            return
+    def _is_duplicate_body(self, response):
+        """True if this exact body was already extracted in this run.
+
+        CMS sites serve the same article under several URLs (tracking params,
+        /amp/ and print variants, mirrored paths); parsing each copy repeats the
+        whole extractor pass and only produces a duplicate row. An 8-byte
+        blake2b digest per page keeps the check cheap; the oldest digests are
+        dropped past _SEEN_BODIES_MAX. Not used when the playwright strategy
+        is configured (see _get_extraction_config).
+        """
+        seen = getattr(self, "_seen_bodies", None)
+        if seen is None:
+            seen = self._seen_bodies = OrderedDict()
+        digest = hashlib.blake2b(response.body, digest_size=8).digest()
+        if digest in seen:
+            logger.debug("Skipping %s: same body as an earlier page", response.url)
+            crawler = getattr(self, "crawler", None)
+            if crawler is not None and crawler.stats is not None:
+                crawler.stats.inc_value("dedup/body_hash")
+            return True
+        seen[digest] = None
+        if len(seen) > _SEEN_BODIES_MAX:
+            seen.popitem(last=False)
+        return False
+
+    def _count_parse_failure(self):
+        """Tally a page that yielded no item in the crawl stats (parse/failed).
+
+        Failed pages are never written as placeholder items; the count is the
+        only record, so it costs nothing in the pipelines or DB.
+        """
+        crawler = getattr(self, "crawler", None)
+        if crawler is not None and crawler.stats is not None:
+            crawler.stats.inc_value("parse/failed")
+
+    def _get_extraction_config(self):
+        """Parse extractor settings and build the SmartExtractor once per spider.
+
+        custom_settings is final by the time responses arrive, so the
+        EXTRACTOR_ORDER / CUSTOM_SELECTORS decoding, the extractor instance and
+        the Playwright kwargs are computed on first use and reused for every
+        page. The summary is logged once here rather than per URL.
+        """
+        cfg = getattr(self, "_extraction_cache", None)
+        if cfg is not None:
+            return cfg
 
         default_strategies = ["trafilatura", "newspaper"]
 
@@ -281,13 +347,8 @@ class BaseDBSpiderMixin:
             or bool(self.custom_settings.get("CUSTOM_SELECTORS"))
         )
         if strategies == ["custom"] and field_extract_set:
-            item = self._build_item_pure_css(response, source_label)
-            if item:
-                yield item
-                self._items_scraped += 1
-            else:
-                logger.warning(f"Pure-CSS extraction failed for {response.url}")
-            return
+            self._extraction_cache = {"pure_css": True, "dedup_body": True}
+            return self._extraction_cache
 
         logger.info(f"Using strategies: {strategies}")
 
@@ -303,17 +364,11 @@ class BaseDBSpiderMixin:
 
         from core.extractors import SmartExtractor
 
-        extractor = SmartExtractor(
-            strategies=strategies, custom_selectors=custom_selectors
+        settings = getattr(self, "settings", None)
+        include_html = (
+            settings.getbool("INCLUDE_HTML_IN_OUTPUT", False) if settings else False
         )
 
-        logger.info(f"Processing {response.url} (Length: {len(response.text)})")
-        title_hint = response.css("title::text").get()
-        if title_hint:
-            logger.info(f"Title tag: {title_hint}")
-
-        include_html = self.settings.getbool("INCLUDE_HTML_IN_OUTPUT", False)
-
         wait_for_selector = self.custom_settings.get("PLAYWRIGHT_WAIT_SELECTOR")
         wait_delay = self.custom_settings.get("PLAYWRIGHT_DELAY", 0)
         enable_scroll = self.custom_settings.get("INFINITE_SCROLL", False)
@@ -329,20 +384,82 @@ class BaseDBSpiderMixin:
                 f"Infinite scroll enabled: {max_scrolls} scrolls with {scroll_delay}s delay"
             )
 
-        article = await extractor.extract(
+        self._extraction_cache = {
+            "pure_css": False,
+            # The playwright strategy re-fetches and renders the URL, so on
+            # JS sites pages sharing one HTML shell still differ once
+            # rendered: the raw-body skip would drop every one but the first.
+            "dedup_body": "playwright" not in strategies,
+            "extractor": SmartExtractor(
+                strategies=strategies, custom_selectors=custom_selectors
+            ),
+            "extract_kwargs": {
+                "include_html": include_html,
+                "wait_for_selector": wait_for_selector,
+                "additional_delay": float(wait_delay) if wait_delay else 0,
+                "enable_scroll": bool(enable_scroll),
+                "max_scrolls": int(max_scrolls) if max_scrolls else 5,
+                "scroll_delay": float(scroll_delay) if scroll_delay else 1.0,
+            },
+        }
+        return self._extraction_cache
+
+    def _item_limit_reached(self):
+        """True once CLOSESPIDER_ITEMCOUNT items have been yielded.
+
+        The closespider extension then shuts the crawl down gracefully, but
+        responses already in flight still reach the callbacks; skipping their
+        extraction avoids parsing pages whose items would only overshoot the
+        limit.
+        """
+        return bool(self._item_limit) and self._items_scraped >= self._item_limit
+
+    async def _extract_article(self, response, source_label="database_spider"):
+        """Shared article extraction logic."""
+        if self._item_limit_reached():
+            return
+
+        # PDFs (and similar binaries) aren't HTML: the extractors can't read them
+        # and response.text/.css would raise. We follow .pdf links on purpose
+        # (see database_spider), so collect the URL as a minimal item here.
+        if self._is_pdf_response(response):
+            yield self._build_pdf_item(response, source_label)
+            self._items_scraped += 1
+            return
+
+        cfg = self._get_extraction_config()
+
+        if cfg["dedup_body"] and self._is_duplicate_body(response):
+            return
+
+        if cfg["pure_css"]:
+            item = self._build_item_pure_css(response, source_label)
+            if item:
+                yield item
+                self._items_scraped += 1
+            else:
+                logger.warning(f"Pure-CSS extraction failed for {response.url}")
+                self._count_parse_failure()
+            return
+
+        logger.debug("Processing %s (Length: %d)", response.url, len(response.body))
+        titles = _TITLE_TEXT(response.selector.root)
+        title_hint = titles[0] if titles else None
+        if title_hint:
+            logger.debug("Title tag: %s", title_hint)
+
+        article = await cfg["extractor"].extract(
             response.url,
             response.text,
             title_hint=title_hint,
-            include_html=include_html,
-            wait_for_selector=wait_for_selector,
-            additional_delay=float(wait_delay) if wait_delay else 0,
-            enable_scroll=bool(enable_scroll),
-            max_scrolls=int(max_scrolls) if max_scrolls else 5,
-            scroll_delay=float(scroll_delay) if scroll_delay else 1.0,
+            **cfg["extract_kwargs"],
         )
 
         if article:
-            item = article.model_dump()
+            # Shallow field copy: the model is discarded right after, so its
+            # metadata/images/videos containers can be handed over as-is
+            # instead of deep-copied by model_dump().
+            item = dict(article)
             item["spider_name"] = self.spider_name
             item["spider_id"] = self.spider_config.id
             item["source"] = source_label
@@ -356,6 +473,7 @@ class BaseDBSpiderMixin:
             self._items_scraped += 1
         else:
             logger.warning(f"Failed to extract article from {response.url}")
+            self._count_parse_failure()
 
     _CORE_SCHEMA_FIELDS = {
         "url",
@@ -423,6 +541,18 @@ class BaseDBSpiderMixin:
                 }
         return directives
 
+    def _get_field_directives(self):
+        """FIELDS directives, resolved on first use and reused for every page.
+
+        Like _get_extraction_config: custom_settings doesn't change mid-crawl,
+        so the JSON decoding and CUSTOM_SELECTORS translation run once.
+        """
+        directives = getattr(self, "_field_directives_cache", None)
+        if directives is None:
+            directives = self._resolve_field_extract_config()
+            self._field_directives_cache = directives
+        return directives
+
     def _apply_field_extract(self, item, response):
         """Populate every project-schema field on the item.
 
@@ -440,7 +570,7 @@ class BaseDBSpiderMixin:
         if schema_fields is None:
             return
 
-        directives = self._resolve_field_extract_config()
+        directives = self._get_field_directives()
 
         from core.processors import apply_processors
 
@@ -613,9 +743,51 @@ class BaseDBSpiderMixin:
         else:
             return result.get()
 
+    def _nested_list_plan(self, config):
+        """Pre-split a nested_list config into leaf and nested fields, once.
+
+        Returns (item_selector, field_order, leaves, nested). Each leaf is
+        (name, field_config, processors, fast) where `fast` is (is_css, query,
+        get_all) for plain selectors that can be run directly, or None when the
+        field needs _extract_field (to_text / to_markdown). Plans are cached per
+        config object; configs live in callbacks_config for the whole crawl.
+        """
+        plans = getattr(self, "_nested_plans", None)
+        if plans is None:
+            plans = self._nested_plans = {}
+        cached = plans.get(id(config))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
+        extract_config = config.get("extract", {})
+        leaves = []
+        nested = []
+        for field_name, field_config in extract_config.items():
+            if field_config.get("type") == "nested_list":
+                nested.append((field_name, field_config))
+                continue
+            css = field_config.get("css")
+            xpath = field_config.get("xpath")
+            fast = None
+            if (css or xpath) and not (
+                field_config.get("to_text") or field_config.get("to_markdown")
+            ):
+                fast = (bool(css), css or xpath, field_config.get("get_all", False))
+            leaves.append(
+                (field_name, field_config, field_config.get("processors", []), fast)
+            )
+
+        plan = (config.get("selector"), tuple(extract_config), leaves, nested)
+        plans[id(config)] = (config, plan)
+        return plan
+
     def _extract_nested_list(self, selector, config, depth=0, max_depth=3):
         """Extract a list of items with nested field extraction.
 
+        Walks nested_list levels with an explicit work stack instead of
+        recursion; each level's field configs are pre-split by
+        _nested_list_plan so the per-row loop only runs selectors.
+
         Args:
             selector: Scrapy Selector object
             config: Dict with 'selector' and 'extract' keys
@@ -625,37 +797,44 @@ class BaseDBSpiderMixin:
         Returns:
             List of dicts with extracted fields
         """
-        if depth >= max_depth:
-            logger.warning(f"Max nesting depth {max_depth} reached, stopping")
-            return []
-
-        item_selector = config.get("selector")
-        extract_config = config.get("extract", {})
+        from core.processors import apply_processors
 
-        if not item_selector or not extract_config:
-            logger.warning("nested_list requires 'selector' and 'extract' keys")
-            return []
+        result = []
+        stack = [(selector, config, depth, result)]
+        while stack:
+            node, level_config, level_depth, out = stack.pop()
+            if level_depth >= max_depth:
+                logger.warning(f"Max nesting depth {max_depth} reached, stopping")
+                continue
 
-        from core.processors import apply_processors
+            item_selector, field_order, leaves, nested = self._nested_list_plan(
+                level_config
+            )
+            if not item_selector or not field_order:
+                logger.warning("nested_list requires 'selector' and 'extract' keys")
+                continue
 
-        items = []
-        for item_node in selector.css(item_selector):
-            item = {}
-            for field_name, field_config in extract_config.items():
-                # Handle nested_list recursively
-                if field_config.get("type") == "nested_list":
-                    item[field_name] = self._extract_nested_list(
-                        item_node, field_config, depth=depth + 1, max_depth=max_depth
-                    )
-                else:
-                    value = self._extract_field(item_node, field_config)
-                    processors = field_config.get("processors", [])
+            for item_node in node.css(item_selector):
+                # Pre-seed keys so fields keep their configured order.
+                item = dict.fromkeys(field_order)
+                for field_name, field_config, processors, fast in leaves:
+                    if fast is not None:
+                        is_css, query, get_all = fast
+                        matched = (
+                            item_node.css(query) if is_css else item_node.xpath(query)
+                        )
+                        value = matched.getall() if get_all else matched.get()
+                    else:
+                        value = self._extract_field(item_node, field_config)
                     if processors:
                         value = apply_processors(value, processors)
                     item[field_name] = value
-            items.append(item)
+                for field_name, field_config in nested:
+                    rows = item[field_name] = []
+                    stack.append((item_node, field_config, level_depth + 1, rows))
+                out.append(item)
 
-        return items
+        return result
 
     async def _extract_ajax_nested_list(self, response, config):
         """Extract nested list from an AJAX endpoint.
@@ -919,12 +1098,16 @@ class BaseDBSpiderMixin:
                         roots.append(item)
 
                 all_items = roots
-                logger.info(
-                    f"Nested {len(all_items)} top-level comments "
-                    f"(from {len(by_id)} total) from {ajax_url}"
+                logger.debug(
+                    "Nested %d top-level comments (from %d total) from %s",
+                    len(all_items),
+                    len(by_id),
+                    ajax_url,
                 )
             else:
-                logger.info(f"AJAX extracted {len(all_items)} items from {ajax_url}")
+                logger.debug(
+                    "AJAX extracted %d items from %s", len(all_items), ajax_url
+                )
 
             return all_items
 
@@ -1013,8 +1196,11 @@ class BaseDBSpiderMixin:
                 )
 
             rows = response.css(row_selector)
-            logger.info(
-                f"Iterate {callback_name}: found {len(rows)} rows on {response.url}"
+            logger.debug(
+                "Iterate %s: found %d rows on %s",
+                callback_name,
+                len(rows),
+                response.url,
             )
 
             for row in rows:
@@ -1056,6 +1242,9 @@ class BaseDBSpiderMixin:
             """Generated callback that extracts custom fields and applies processors."""
             from core.processors import apply_processors
 
+            if self._item_limit_reached():
+                return
+
             extract_config = callback_config.get("extract") or {}
             if not extract_config:
                 logger.warning(
@@ -1101,8 +1290,11 @@ class BaseDBSpiderMixin:
                 # Store custom fields directly on item (pipeline will move to metadata_json)
                 item[field_name] = value
 
-            logger.info(
-                f"Extracted {len(extract_config)} fields from {response.url} using {callback_name}"
+            logger.debug(
+                "Extracted %d fields from %s using %s",
+                len(extract_config),
+                response.url,
+                callback_name,
             )
 
             yield item
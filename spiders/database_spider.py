@@ -5,6 +5,7 @@ from core.db import get_db
 from core.models import Spider
 from .base import BaseDBSpiderMixin, _pdf_links
 import datetime as _dt
+import functools as _ft
 import itertools as _it
 import logging
 import re
@@ -12,6 +13,23 @@ import re
 logger = logging.getLogger(__name__)
 
 
+@_ft.lru_cache(maxsize=1024)
+def _compile_pattern(pattern):
+    """Compile a rule regex once per process.
+
+    Rule patterns are plain strings in the DB. Compiling them here and handing
+    the compiled objects to LinkExtractor (which accepts re.Pattern as-is) and
+    to parse_start_url means every spider instance with the same rules reuses
+    one compiled pattern, instead of relying on `re`'s small internal cache.
+    """
+    return re.compile(pattern)
+
+
+def _compile_patterns(patterns):
+    """[re.Pattern] for a rule's allow/deny list (None/empty -> [])."""
+    return [_compile_pattern(p) for p in patterns or []]
+
+
 def _expand_var(v):
     """One GENERATED_URLS variable -> a list of string values.
 
@@ -144,11 +162,12 @@ class DatabaseSpider(BaseDBSpiderMixin, CrawlSpider):
 
             # Compile rules AFTER callbacks are registered
             self.rules = []
-            # (allow_patterns, callback) for each content rule (priority order),
-            # used to decide whether a start URL is itself content. Captured here,
-            # inside the DB session, to avoid touching detached ORM objects later.
+            # (compiled allow patterns, callback) for each content rule (priority
+            # order), used to decide whether a start URL is itself content.
+            # Captured here, inside the DB session, to avoid touching detached
+            # ORM objects later.
             self._start_match_rules = []
-            db_rules = sorted(spider.rules, key=lambda r: r.priority, reverse=True)
+            db_rules = spider.rules  # already priority-ordered by the relationship
 
             # PDF_MODE governs whether .pdf links are followed. "extract" follows
             # and downloads them; "links_only" (default) leaves them to be
@@ -167,10 +186,11 @@ class DatabaseSpider(BaseDBSpiderMixin, CrawlSpider):
                     le_kwargs["deny_extensions"] = [
                         e for e in IGNORED_EXTENSIONS if e != "pdf"
                     ]
-                if r.allow_patterns:
-                    le_kwargs["allow"] = r.allow_patterns
+                allow_res = _compile_patterns(r.allow_patterns)
+                if allow_res:
+                    le_kwargs["allow"] = allow_res
                 if r.deny_patterns:
-                    le_kwargs["deny"] = r.deny_patterns
+                    le_kwargs["deny"] = _compile_patterns(r.deny_patterns)
                 if r.restrict_xpaths:
                     le_kwargs["restrict_xpaths"] = r.restrict_xpaths
                 if r.restrict_css:
@@ -194,7 +214,7 @@ class DatabaseSpider(BaseDBSpiderMixin, CrawlSpider):
                 # Only rules with a real callback parse content; follow-only
                 # rules (callback=None) just extract links and never apply here.
                 if callback:
-                    self._start_match_rules.append((r.allow_patterns or [], callback))
+                    self._start_match_rules.append((allow_res, callback))
 
             # Load settings and CF handlers via mixin
             self._load_settings_from_db(spider)
@@ -254,7 +274,7 @@ class DatabaseSpider(BaseDBSpiderMixin, CrawlSpider):
         # Parse with the first content rule whose pattern the start URL matches.
         # A content rule with no allow patterns is a deliberate match-all.
         for allow_patterns, callback in self._start_match_rules:
-            if not allow_patterns or any(re.search(p, url) for p in allow_patterns):
+            if not allow_patterns or any(p.search(url) for p in allow_patterns):
                 logger.info(f"Start URL is content, using callback: {callback}")
                 callback_method = getattr(self, callback, None)
                 if callback_method:
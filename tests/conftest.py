@@ -2,21 +2,21 @@
 Pytest configuration and shared fixtures for ScrapAI CLI tests.
 
 This module provides:
-- Database fixtures (temporary SQLite DB for testing)
+- Database fixtures (in-memory SQLite DB, rolled back per test)
 - Spider configuration fixtures
 - Sample HTML content fixtures
 - Mock browser clients
 """
 
-import os
-import tempfile
 from pathlib import Path
 from typing import Generator
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
+import core.config as config_module
 from core.models import Base, Spider  # noqa: F401 - used in fixtures
 
 
@@ -26,16 +26,54 @@ def test_data_dir() -> Path:
     return Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="session")
+def _db_engine():
+    """Engine for one in-memory SQLite database, schema created once per run.
+
+    StaticPool hands every checkout the same connection, which is what keeps
+    an in-memory database alive and visible across sessions. temp_db gives
+    each test its own transaction on it and rolls it back afterwards.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages transactions itself and gets SAVEPOINTs wrong; turn
+    # that off and have SQLAlchemy emit BEGIN so temp_db's rollback is real.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Fresh in-memory database: skip the per-table existence probes and run
+    # all DDL in one transaction.
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, checkfirst=False)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
 @pytest.fixture(scope="function")
-def temp_db(monkeypatch) -> Generator[Session, None, None]:
+def temp_db(_db_engine, monkeypatch) -> Generator[Session, None, None]:
     """
-    Create a temporary SQLite database for testing.
+    Provide a session on the shared test database, rolled back after the test.
+
+    The session is bound to a connection whose outer transaction is never
+    committed; session.commit() only releases a SAVEPOINT, so tests can commit
+    freely and still leave the database empty for the next test.
 
-    Also patches get_db() to return this temporary session,
+    Also patches get_db() to return this session,
     so spiders can access test data.
 
     Yields:
-        SQLAlchemy Session connected to temporary database
+        SQLAlchemy Session connected to the in-memory test database
 
     Usage:
         def test_spider_creation(temp_db):
@@ -44,16 +82,9 @@ def temp_db(monkeypatch) -> Generator[Session, None, None]:
             temp_db.commit()
             assert spider.id is not None
     """
-    # Create temporary database file
-    db_fd, db_path = tempfile.mkstemp(suffix=".db")
-    engine = create_engine(f"sqlite:///{db_path}")
-
-    # Create all tables
-    Base.metadata.create_all(engine)
-
-    # Create session
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    connection = _db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     # Patch get_db() where it's used (in spiders.database_spider module).
     # get_db is now a @contextmanager, so the mock must implement the context
@@ -70,9 +101,26 @@ def temp_db(monkeypatch) -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
-        engine.dispose()
-        os.close(db_fd)
-        os.unlink(db_path)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def scrapy_settings():
+    """Scrapy's default settings, built once and frozen for sharing.
+
+    Spiders under test read crawler settings (e.g. INCLUDE_HTML_IN_OUTPUT)
+    from ``spider.settings``, which Scrapy normally sets. Frozen, so a test
+    can't leak changes into the next one.
+
+    Usage:
+        spider.settings = scrapy_settings
+    """
+    from scrapy.settings import Settings
+
+    settings = Settings()
+    settings.freeze()
+    return settings
 
 
 @pytest.fixture(scope="function")
@@ -108,6 +156,42 @@ def sample_spider_config(sample_project_name: str) -> dict:
     }
 
 
+@pytest.fixture(scope="function")
+def make_spider(temp_db: Session, sample_spider_config: dict):
+    """
+    Return a factory that stores a Spider, its rules and settings in temp_db.
+
+    Rules and settings ride on the Spider's relationships, so the whole
+    config is written with a single commit. Setting values are serialized
+    the way ``spiders import`` stores them (lists/dicts as JSON).
+
+    Usage:
+        def test_spider_rules(make_spider):
+            spider_config = make_spider(
+                rules=[{"allow_patterns": [r"/article/.*"], "follow": True}],
+                settings={"EXTRACTOR_ORDER": ["newspaper"]},
+            )
+    """
+    import json
+
+    from core.models import SpiderRule, SpiderSetting
+
+    def _setting(key, value):
+        if isinstance(value, (list, dict)):
+            return SpiderSetting(key=key, value=json.dumps(value), type="json")
+        return SpiderSetting(key=key, value=str(value), type=type(value).__name__)
+
+    def _make(name="test_spider", rules=None, settings=None, **overrides):
+        spider = Spider(**{**sample_spider_config, "name": name, **overrides})
+        spider.rules = [SpiderRule(**rule) for rule in rules or []]
+        spider.settings = [_setting(k, v) for k, v in (settings or {}).items()]
+        temp_db.add(spider)
+        temp_db.commit()
+        return spider
+
+    return _make
+
+
 @pytest.fixture(scope="session")
 def sample_html_simple() -> str:
     """
@@ -179,6 +263,18 @@ def sample_html_complex() -> str:
 </html>"""
 
 
+@pytest.fixture(scope="session")
+def sample_html_simple_bytes(sample_html_simple: str) -> bytes:
+    """sample_html_simple encoded once, for HtmlResponse(body=...)."""
+    return sample_html_simple.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_html_complex_bytes(sample_html_complex: str) -> bytes:
+    """sample_html_complex encoded once, for HtmlResponse(body=...)."""
+    return sample_html_complex.encode("utf-8")
+
+
 @pytest.fixture(scope="session")
 def sample_html_malformed() -> str:
     """
@@ -261,21 +357,19 @@ def temp_data_dir(tmp_path: Path) -> Path:
     return data_dir
 
 
-@pytest.fixture(autouse=True)
-def reset_config(monkeypatch):
-    """
-    Reset global configuration between tests.
-
-    Prevents test pollution from environment variables or config changes.
+@pytest.fixture
+def isolated_config(monkeypatch):
     """
-    # Store original env vars
-    import core.config as config_module
-
-    original_data_dir = config_module.DATA_DIR
-    original_log_level = config_module.LOG_LEVEL
+    Restore core.config globals after a test that reassigns them.
 
-    yield
+    Opt-in (not autouse): most tests never touch core.config, and the ones
+    that do usually monkeypatch the attribute themselves. monkeypatch records
+    the current values here and puts them back on teardown.
 
-    # Restore original values
-    config_module.DATA_DIR = original_data_dir
-    config_module.LOG_LEVEL = original_log_level
+    Usage:
+        def test_process_pool(isolated_config):
+            isolated_config.EXTRACT_PROCESSES = 1
+    """
+    for name in ("DATA_DIR", "LOG_LEVEL", "EXTRACT_PROCESSES"):
+        monkeypatch.setattr(config_module, name, getattr(config_module, name))
+    return config_module
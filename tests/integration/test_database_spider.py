@@ -13,33 +13,27 @@ from scrapy.http import HtmlResponse
 from sqlalchemy.orm import Session
 
 from spiders.database_spider import DatabaseSpider
-from core.models import Spider, ScrapedItem, SpiderRule, SpiderSetting
+from core.models import ScrapedItem
 
 
 class TestDatabaseSpider:
     """Integration tests for DatabaseSpider functionality."""
 
     @pytest.mark.integration
-    def test_spider_loads_config_from_database(
-        self, temp_db: Session, sample_project_name: str
+    def test_spider_loads_config_and_compiles_rules(
+        self, make_spider, sample_project_name: str
     ):
-        """Test that spider correctly loads configuration from database."""
-        # Create spider in database
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
-
-        # Add a rule
-        rule = SpiderRule(
-            spider_id=spider_config.id, allow_patterns=[r"/article/.*"], follow=True
+        """Spider loads its configuration and compiles URL rules from the DB."""
+        # Create spider (with one rule) in database
+        make_spider(
+            rules=[
+                {
+                    "allow_patterns": [r"/article/.*"],
+                    "deny_patterns": [r"/tag/.*"],
+                    "follow": True,
+                }
+            ]
         )
-        temp_db.add(rule)
-        temp_db.commit()
 
         # Instantiate spider
         spider = DatabaseSpider(
@@ -54,38 +48,8 @@ class TestDatabaseSpider:
         assert "example.com" in spider.allowed_domains
         assert "https://example.com/" in spider.start_urls
 
-    @pytest.mark.integration
-    def test_spider_compiles_url_rules(
-        self, temp_db: Session, sample_project_name: str
-    ):
-        """Test that spider compiles URL matching rules correctly."""
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
-
-        # Add rules
-        rule = SpiderRule(
-            spider_id=spider_config.id,
-            allow_patterns=[r"/article/.*"],
-            deny_patterns=[r"/tag/.*"],
-            follow=True,
-        )
-        temp_db.add(rule)
-        temp_db.commit()
-
-        spider = DatabaseSpider(
-            spider_name="test_spider", project_name=sample_project_name
-        )
-
-        # Verify rules were compiled
+        # Verify rules were compiled with the correct configuration
         assert len(spider.rules) > 0
-
-        # Verify rule has correct configuration
         rule = spider.rules[0]
         assert rule.link_extractor is not None
         assert rule.follow is True
@@ -93,45 +57,27 @@ class TestDatabaseSpider:
     @pytest.mark.integration
     async def test_spider_extracts_article_content(
         self,
-        temp_db: Session,
+        make_spider,
         sample_project_name: str,
-        sample_html_simple: str,
-        mocker,
+        sample_html_simple_bytes: bytes,
+        scrapy_settings,
     ):
         """Test end-to-end article extraction."""
-        # Create spider
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
-
-        # Add extractor settings
-        setting = SpiderSetting(
-            spider_id=spider_config.id,
-            key="EXTRACTOR_ORDER",
-            value='["newspaper", "trafilatura"]',
-            type="json",
-        )
-        temp_db.add(setting)
-        temp_db.commit()
+        # Create spider with extractor settings
+        make_spider(settings={"EXTRACTOR_ORDER": ["newspaper", "trafilatura"]})
 
         # Create spider instance
         spider = DatabaseSpider(
             spider_name="test_spider", project_name=sample_project_name
         )
 
-        # Mock Scrapy settings (normally set by Scrapy framework)
-        spider.settings = mocker.Mock()
-        spider.settings.getbool = mocker.Mock(return_value=False)
+        # Scrapy settings (normally set by the crawler)
+        spider.settings = scrapy_settings
 
         # Create mock response
         response = HtmlResponse(
             url="https://example.com/article/test",
-            body=sample_html_simple.encode("utf-8"),
+            body=sample_html_simple_bytes,
             encoding="utf-8",
         )
 
@@ -151,19 +97,10 @@ class TestDatabaseSpider:
         assert article_item["url"] == "https://example.com/article/test"
 
     @pytest.mark.integration
-    def test_spider_saves_articles_to_database(
-        self, temp_db: Session, sample_project_name: str
-    ):
+    def test_spider_saves_articles_to_database(self, temp_db: Session, make_spider):
         """Test that extracted articles are saved to database."""
         # Create spider
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        spider_config = make_spider()
 
         # Create scraped item manually (simulating spider pipeline)
         item = ScrapedItem(
@@ -188,17 +125,10 @@ class TestDatabaseSpider:
         assert saved_item.spider_id == spider_config.id
 
     @pytest.mark.integration
-    def test_spider_deduplicates_urls(self, temp_db: Session, sample_project_name: str):
+    def test_spider_deduplicates_urls(self, temp_db: Session, make_spider):
         """Test that spider doesn't re-scrape existing URLs."""
         # Create spider and scraped item
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        spider_config = make_spider()
 
         # Add existing item
         existing_item = ScrapedItem(
@@ -241,57 +171,38 @@ class TestSpiderWithCustomSelectors:
     @pytest.mark.integration
     async def test_spider_uses_custom_selectors(
         self,
-        temp_db: Session,
+        make_spider,
         sample_project_name: str,
-        sample_html_complex: str,
-        mocker,
+        sample_html_complex_bytes: bytes,
+        scrapy_settings,
     ):
         """Test extraction with custom CSS selectors."""
         # Create spider with custom selectors
-        spider_config = Spider(
+        make_spider(
             name="custom_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
+            settings={
+                "EXTRACTOR_ORDER": ["custom", "newspaper"],
+                "CUSTOM_SELECTORS": {
+                    "title": "h1.article-title-custom",
+                    "content": "div.article-text",
+                    "author": "span.author-name",
+                    "date": "span.publish-date",
+                },
+            },
         )
-        temp_db.add(spider_config)
-        temp_db.commit()
-
-        # Add custom settings
-        settings = [
-            SpiderSetting(
-                spider_id=spider_config.id,
-                key="EXTRACTOR_ORDER",
-                value='["custom", "newspaper"]',
-                type="json",
-            ),
-            SpiderSetting(
-                spider_id=spider_config.id,
-                key="CUSTOM_SELECTORS",
-                value=(
-                    '{"title": "h1.article-title-custom", "content": "div.article-text", '
-                    '"author": "span.author-name", "date": "span.publish-date"}'
-                ),
-                type="json",
-            ),
-        ]
-        for setting in settings:
-            temp_db.add(setting)
-        temp_db.commit()
 
         # Create spider instance
         spider = DatabaseSpider(
             spider_name="custom_spider", project_name=sample_project_name
         )
 
-        # Mock Scrapy settings (normally set by Scrapy framework)
-        spider.settings = mocker.Mock()
-        spider.settings.getbool = mocker.Mock(return_value=False)
+        # Scrapy settings (normally set by the crawler)
+        spider.settings = scrapy_settings
 
         # Create mock response with complex HTML
         response = HtmlResponse(
             url="https://example.com/article/complex",
-            body=sample_html_complex.encode("utf-8"),
+            body=sample_html_complex_bytes,
             encoding="utf-8",
         )
 
@@ -314,25 +225,17 @@ class TestSpiderErrorHandling:
 
     @pytest.mark.integration
     async def test_spider_handles_extraction_failure(
-        self, temp_db: Session, sample_project_name: str, mocker
+        self, make_spider, sample_project_name: str, scrapy_settings
     ):
         """Test that spider handles extraction failures gracefully."""
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        make_spider()
 
         spider = DatabaseSpider(
             spider_name="test_spider", project_name=sample_project_name
         )
 
-        # Mock Scrapy settings (normally set by Scrapy framework)
-        spider.settings = mocker.Mock()
-        spider.settings.getbool = mocker.Mock(return_value=False)
+        # Scrapy settings (normally set by the crawler)
+        spider.settings = scrapy_settings
 
         # Empty HTML response
         response = HtmlResponse(
@@ -361,44 +264,8 @@ class TestSpiderWithCallbacks:
     """Test spider behavior with named callbacks."""
 
     @pytest.mark.integration
-    def test_spider_loads_callbacks_from_db(
-        self, temp_db: Session, sample_project_name: str
-    ):
-        """Test that spider loads callbacks_config from database."""
-        # Create spider with callbacks
-        callbacks_config = {
-            "parse_product": {
-                "extract": {
-                    "name": {"css": "h1.product-title::text"},
-                    "price": {"css": "span.price::text"},
-                }
-            }
-        }
-
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-            callbacks_config=callbacks_config,
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
-
-        # Instantiate spider
-        spider = DatabaseSpider(
-            spider_name="test_spider", project_name=sample_project_name
-        )
-
-        # Verify callbacks loaded
-        assert hasattr(spider, "parse_product")
-        assert callable(spider.parse_product)
-
-    @pytest.mark.integration
-    def test_dynamic_callback_registered(
-        self, temp_db: Session, sample_project_name: str
-    ):
-        """Test that dynamic callback methods are registered correctly."""
+    def test_dynamic_callback_registered(self, make_spider, sample_project_name: str):
+        """Callbacks load from callbacks_config and register as methods."""
         callbacks_config = {
             "parse_product": {
                 "extract": {
@@ -414,15 +281,7 @@ class TestSpiderWithCallbacks:
             },
         }
 
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-            callbacks_config=callbacks_config,
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        make_spider(callbacks_config=callbacks_config)
 
         spider = DatabaseSpider(
             spider_name="test_spider", project_name=sample_project_name
@@ -431,12 +290,14 @@ class TestSpiderWithCallbacks:
         # Both callbacks should be registered
         assert hasattr(spider, "parse_product")
         assert hasattr(spider, "parse_review")
+        assert callable(spider.parse_product)
+        assert callable(spider.parse_review)
         assert spider.parse_product.__name__ == "standard_callback"
         assert spider.parse_review.__name__ == "standard_callback"
 
     @pytest.mark.integration
     async def test_callback_extracts_custom_fields(
-        self, temp_db: Session, sample_project_name: str, mocker
+        self, make_spider, sample_project_name: str, scrapy_settings
     ):
         """Test that callbacks extract custom fields correctly."""
         callbacks_config = {
@@ -449,23 +310,14 @@ class TestSpiderWithCallbacks:
             }
         }
 
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-            callbacks_config=callbacks_config,
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        make_spider(callbacks_config=callbacks_config)
 
         spider = DatabaseSpider(
             spider_name="test_spider", project_name=sample_project_name
         )
 
-        # Mock Scrapy settings
-        spider.settings = mocker.Mock()
-        spider.settings.getbool = mocker.Mock(return_value=False)
+        # Scrapy settings (normally set by the crawler)
+        spider.settings = scrapy_settings
 
         # Create mock response
         html = """
@@ -501,19 +353,11 @@ class TestSpiderWithCallbacks:
 
     @pytest.mark.integration
     def test_legacy_spider_without_callbacks(
-        self, temp_db: Session, sample_project_name: str
+        self, make_spider, sample_project_name: str
     ):
         """Test that legacy spiders without callbacks still work."""
-        # Create spider without callbacks_config
-        spider_config = Spider(
-            name="legacy_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-            # callbacks_config is None (legacy spider)
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        # Create spider without callbacks_config (None: legacy spider)
+        make_spider(name="legacy_spider")
 
         # Should work normally with parse_article
         spider = DatabaseSpider(
@@ -526,7 +370,7 @@ class TestSpiderWithCallbacks:
 
     @pytest.mark.integration
     async def test_callback_with_processors(
-        self, temp_db: Session, sample_project_name: str, mocker
+        self, make_spider, sample_project_name: str, scrapy_settings
     ):
         """Test callbacks with field processors."""
         callbacks_config = {
@@ -544,22 +388,13 @@ class TestSpiderWithCallbacks:
             }
         }
 
-        spider_config = Spider(
-            name="test_spider",
-            project=sample_project_name,
-            allowed_domains=["example.com"],
-            start_urls=["https://example.com/"],
-            callbacks_config=callbacks_config,
-        )
-        temp_db.add(spider_config)
-        temp_db.commit()
+        make_spider(callbacks_config=callbacks_config)
 
         spider = DatabaseSpider(
             spider_name="test_spider", project_name=sample_project_name
         )
 
-        spider.settings = mocker.Mock()
-        spider.settings.getbool = mocker.Mock(return_value=False)
+        spider.settings = scrapy_settings
 
         html = """
         <html>
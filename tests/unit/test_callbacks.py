@@ -342,6 +342,42 @@ class TestFieldExtraction:
         result = mixin._extract_nested_list(selector, config, depth=3, max_depth=3)
         assert result == []
 
+    def test_extract_nested_list_multi_level(self):
+        from spiders.base import BaseDBSpiderMixin
+
+        html = """
+        <div class='thread'>
+            <h2>T1</h2>
+            <div class='reply'><p>r1</p></div>
+            <div class='reply'><p>r2</p></div>
+        </div>
+        <div class='thread'><h2>T2</h2></div>
+        """
+        selector = Selector(text=html)
+
+        mixin = BaseDBSpiderMixin()
+        config = {
+            "selector": "div.thread",
+            "extract": {
+                "replies": {
+                    "type": "nested_list",
+                    "selector": "div.reply",
+                    "extract": {"body": {"css": "p", "to_text": True}},
+                },
+                "title": {"xpath": "./h2/text()"},
+            },
+        }
+
+        result = mixin._extract_nested_list(selector, config)
+        # Same plan is reused on the second call.
+        assert mixin._extract_nested_list(selector, config) == result
+
+        assert result == [
+            {"replies": [{"body": "r1"}, {"body": "r2"}], "title": "T1"},
+            {"replies": [], "title": "T2"},
+        ]
+        assert list(result[0]) == ["replies", "title"]
+
 
 class TestIterateSchemas:
     """Test iterate-related schema validation."""
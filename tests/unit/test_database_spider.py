@@ -5,7 +5,8 @@ Integration tests cover the happy path, these cover error conditions.
 """
 
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from scrapy.http import HtmlResponse
 from spiders.database_spider import DatabaseSpider
 from core.models import Spider, SpiderRule
 
@@ -127,6 +128,45 @@ class TestRuleCompilation:
                 # Rule should be compiled with all patterns
                 assert len(spider.rules) == 1
 
+    @pytest.mark.unit
+    @patch("spiders.database_spider.get_db")
+    def test_rule_patterns_compiled_once_across_instances(self, mock_get_db):
+        """Identical rule patterns share one compiled re.Pattern per process."""
+        mock_rule = Mock(spec=SpiderRule)
+        mock_rule.allow_patterns = ["/article/\\d+"]
+        mock_rule.deny_patterns = ["/tag/"]
+        mock_rule.restrict_xpaths = None
+        mock_rule.restrict_css = None
+        mock_rule.tags = None
+        mock_rule.callback = None
+        mock_rule.follow = True
+        mock_rule.priority = 0
+
+        mock_spider = Mock(spec=Spider)
+        mock_spider.name = "test_spider"
+        mock_spider.active = True
+        mock_spider.allowed_domains = ["example.com"]
+        mock_spider.start_urls = ["https://example.com"]
+        mock_spider.rules = [mock_rule]
+        mock_spider.callbacks_config = {}
+        mock_spider.settings = []
+
+        mock_db = Mock()
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_spider
+        cm = MagicMock()
+        cm.__enter__.return_value = mock_db
+        mock_get_db.return_value = cm
+
+        with patch.object(DatabaseSpider, "_load_settings_from_db"):
+            with patch.object(DatabaseSpider, "_setup_cloudflare_handlers"):
+                first = DatabaseSpider(spider_name="test_spider")
+                second = DatabaseSpider(spider_name="test_spider")
+
+        le_first = first.rules[0].link_extractor
+        le_second = second.rules[0].link_extractor
+        assert le_first.allow_res[0] is le_second.allow_res[0]
+        assert le_first.deny_res[0] is le_second.deny_res[0]
+
 
 class TestCallbackRegistration:
     """Test callback registration from database configuration."""
@@ -189,3 +229,177 @@ class TestCallbackRegistration:
 
                 # Should initialize successfully with no callbacks
                 assert spider.spider_name == "test_spider"
+
+
+class TestExtractionConfig:
+    """Extractor settings are decoded once per spider, not per response."""
+
+    @pytest.fixture
+    def spider(self):
+        mock_spider = Mock(spec=Spider)
+        mock_spider.name = "test_spider"
+        mock_spider.active = True
+        mock_spider.allowed_domains = ["example.com"]
+        mock_spider.start_urls = ["https://example.com"]
+        mock_spider.rules = []
+        mock_spider.callbacks_config = {}
+        mock_spider.settings = []
+
+        mock_db = Mock()
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_spider
+        cm = MagicMock()
+        cm.__enter__.return_value = mock_db
+
+        with patch("spiders.database_spider.get_db", return_value=cm):
+            with patch.object(DatabaseSpider, "_load_settings_from_db"):
+                with patch.object(DatabaseSpider, "_setup_cloudflare_handlers"):
+                    spider = DatabaseSpider(spider_name="test_spider")
+        spider.crawler = Mock()
+        return spider
+
+    @pytest.fixture
+    def spider_with_extractor(self, spider):
+        """The spider with a prebuilt extraction config around a mock extractor."""
+        extractor = Mock()
+        extractor.extract = AsyncMock(return_value=None)
+        spider._extraction_cache = {
+            "pure_css": False,
+            "dedup_body": True,
+            "extractor": extractor,
+            "extract_kwargs": {},
+        }
+        return spider, extractor
+
+    @pytest.mark.unit
+    def test_extractor_built_once_and_reused(self, spider):
+        spider.custom_settings = {
+            "EXTRACTOR_ORDER": '["newspaper"]',
+            "CUSTOM_SELECTORS": '{"title": "h1"}',
+            "PLAYWRIGHT_DELAY": "2",
+        }
+        with patch("core.extractors.SmartExtractor") as mock_cls:
+            first = spider._get_extraction_config()
+            second = spider._get_extraction_config()
+
+        mock_cls.assert_called_once_with(
+            strategies=["newspaper"], custom_selectors={"title": "h1"}
+        )
+        assert first is second
+        assert first["extract_kwargs"]["additional_delay"] == 2.0
+
+    @pytest.mark.unit
+    async def test_failed_extraction_only_counts_a_stat(self, spider_with_extractor):
+        """A page that extracts nothing yields no item, just parse/failed."""
+        spider, extractor = spider_with_extractor
+        response = HtmlResponse(
+            url="https://example.com/a", body=b"<html></html>", encoding="utf-8"
+        )
+
+        items = [i async for i in spider._extract_article(response)]
+
+        assert items == []
+        spider.crawler.stats.inc_value.assert_called_once_with("parse/failed")
+        assert extractor.extract.call_args.kwargs["title_hint"] is None
+
+    @pytest.mark.unit
+    async def test_title_hint_read_from_title_tag(self, spider_with_extractor):
+        spider, extractor = spider_with_extractor
+        response = HtmlResponse(
+            url="https://example.com/a",
+            body=b"<html><head><title>Q&amp;A: Budget</title></head></html>",
+            encoding="utf-8",
+        )
+
+        [i async for i in spider._extract_article(response)]
+
+        assert extractor.extract.call_args.kwargs["title_hint"] == "Q&A: Budget"
+
+    @pytest.mark.unit
+    async def test_duplicate_body_is_extracted_once(self, spider_with_extractor):
+        """A second URL serving byte-identical HTML is skipped before parsing."""
+        spider, extractor = spider_with_extractor
+        body = b"<html><title>Same</title></html>"
+        for url in ("https://example.com/a", "https://example.com/a?utm=x"):
+            response = HtmlResponse(url=url, body=body, encoding="utf-8")
+            [i async for i in spider._extract_article(response)]
+
+        extractor.extract.assert_awaited_once()
+        spider.crawler.stats.inc_value.assert_any_call("dedup/body_hash")
+
+    @pytest.mark.unit
+    async def test_shared_shell_rendered_per_url_with_playwright(self, spider):
+        """JS sites serve one HTML shell for every article; playwright renders
+        each URL, so identical raw bodies must not be skipped."""
+        from core.schemas import ScrapedArticle
+
+        spider.custom_settings = {
+            "EXTRACTOR_ORDER": '["trafilatura"]',
+            "INFINITE_SCROLL": True,
+        }
+        shell = b"<html><body><div id='app'></div></body></html>"
+        urls = ("https://example.com/a", "https://example.com/b")
+        rendered = [
+            ScrapedArticle(
+                url=url,
+                title=url[-1],
+                content=f"Article {url[-1]}",
+                source="playwright",
+            )
+            for url in urls
+        ]
+
+        with patch("core.extractors.SmartExtractor") as mock_cls:
+            mock_cls.return_value.extract = AsyncMock(side_effect=rendered)
+            with patch.object(spider, "_apply_field_extract"):
+                items = [
+                    i
+                    for url in urls
+                    async for i in spider._extract_article(
+                        HtmlResponse(url=url, body=shell, encoding="utf-8")
+                    )
+                ]
+
+        assert [i["content"] for i in items] == ["Article a", "Article b"]
+        assert mock_cls.call_args.kwargs["strategies"] == ["trafilatura", "playwright"]
+
+    @pytest.mark.unit
+    async def test_article_fields_copied_into_item(self, spider_with_extractor):
+        """The yielded item carries every ScrapedArticle field plus spider info."""
+        from core.schemas import ScrapedArticle
+
+        spider, extractor = spider_with_extractor
+        spider.spider_config.id = 3
+        article = ScrapedArticle(
+            url="https://example.com/a",
+            title="T",
+            content="body",
+            source="trafilatura",
+            images=[{"src": "https://example.com/i.png"}],
+        )
+        expected = article.model_dump()
+        extractor.extract.return_value = article
+        response = HtmlResponse(
+            url="https://example.com/a", body=b"<html></html>", encoding="utf-8"
+        )
+
+        with patch.object(spider, "_apply_field_extract"):
+            (item,) = [i async for i in spider._extract_article(response)]
+
+        assert item["images"] == expected["images"]
+        assert item["title"] == "T"
+        assert item["spider_id"] == 3
+        assert item["source"] == "database_spider"
+        assert set(expected) <= set(item)
+
+    @pytest.mark.unit
+    async def test_no_extraction_once_item_limit_reached(self, spider_with_extractor):
+        """In-flight responses after CLOSESPIDER_ITEMCOUNT are not parsed."""
+        spider, extractor = spider_with_extractor
+        spider._item_limit = 2
+        spider._items_scraped = 2
+        response = HtmlResponse(
+            url="https://example.com/late", body=b"<html></html>", encoding="utf-8"
+        )
+
+        assert [i async for i in spider._extract_article(response)] == []
+        extractor.extract.assert_not_awaited()
@@ -115,3 +115,11 @@ class TestGetDbRollback:
         with get_db() as db:
             assert db.query(Spider).filter_by(name="kept").count() == 1
             assert db.query(Spider).filter_by(name="lost").count() == 0
+
+
+class TestEngineOptions:
+    @pytest.mark.unit
+    def test_pool_survives_idle_connections(self):
+        """Every backend pings pooled connections and recycles them hourly."""
+        opts = core_db._engine_options()
+        assert opts == {"pool_pre_ping": True, "pool_recycle": 3600}
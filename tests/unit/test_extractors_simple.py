@@ -5,6 +5,7 @@ Tests basic functionality without deep assertions on extraction logic.
 """
 
 import pytest
+from unittest.mock import Mock, patch
 from hypothesis import given, strategies as st
 
 from core.extractors import (
@@ -86,6 +87,18 @@ class TestNewspaperExtractor:
         # Should return None, not crash
         assert result is None
 
+    @pytest.mark.unit
+    def test_does_not_download_images(self, sample_html_simple):
+        """Top-image selection must not fetch image URLs from the worker."""
+        from newspaper.extractors.image_extractor import ImageExtractor
+
+        html = sample_html_simple.replace(
+            "</p>", '</p><img src="https://example.com/photo.jpg">', 1
+        )
+        with patch.object(ImageExtractor, "_fetch_image") as fetch:
+            NewspaperExtractor().extract(url="https://example.com/article", html=html)
+        fetch.assert_not_called()
+
     @pytest.mark.unit
     def test_include_html_option(self, sample_html_simple):
         """Test that include_html option works."""
@@ -321,6 +334,89 @@ class TestSmartExtractor:
         # Should get a result from one of the strategies
         assert result is None or isinstance(result, ScrapedArticle)
 
+    @pytest.mark.unit
+    async def test_process_pool_matches_thread_result(
+        self, sample_html_simple, monkeypatch, isolated_config
+    ):
+        """EXTRACT_PROCESSES>0 runs extraction in workers with the same output."""
+        import core.extractors as ex
+
+        url = "https://example.com/article"
+        threaded = await ex._run_cpu_extractor(
+            "trafilatura", url, sample_html_simple, None, False
+        )
+
+        isolated_config.EXTRACT_PROCESSES = 1
+        monkeypatch.setattr(ex, "_process_pool", None)
+        try:
+            pooled = await ex._run_cpu_extractor(
+                "trafilatura", url, sample_html_simple, None, False
+            )
+            assert ex._process_pool is not None
+        finally:
+            if ex._process_pool is not None:
+                ex._process_pool.shutdown()
+
+        assert (pooled is None) == (threaded is None)
+        if pooled:
+            assert pooled.content == threaded.content
+
+    @pytest.mark.unit
+    async def test_broken_process_pool_falls_back_to_thread(
+        self, sample_html_simple, monkeypatch
+    ):
+        """A dead worker drops the pool and the page is extracted on a thread."""
+        from concurrent.futures.process import BrokenProcessPool
+        import core.extractors as ex
+
+        class DeadPool:
+            shut_down = False
+
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, wait=True):
+                self.shut_down = True
+
+        pool = DeadPool()
+        monkeypatch.setattr(ex, "_process_pool", pool)
+        url = "https://example.com/article"
+
+        result = await ex._run_cpu_extractor(
+            "trafilatura", url, sample_html_simple, None, False
+        )
+
+        threaded = await ex._run_cpu_extractor(
+            "trafilatura", url, sample_html_simple, None, False
+        )
+        assert (result is None) == (threaded is None)
+        if result:
+            assert result.content == threaded.content
+        assert ex._process_pool is None
+        assert pool.shut_down
+
+    @pytest.mark.unit
+    def test_shutdown_process_pool(self, monkeypatch):
+        import core.extractors as ex
+
+        pool = Mock()
+        monkeypatch.setattr(ex, "_process_pool", pool)
+
+        ex.shutdown_process_pool()
+        ex.shutdown_process_pool()
+
+        pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert ex._process_pool is None
+
+    @pytest.mark.unit
+    def test_non_integer_extract_processes_falls_back_to_threads(self, monkeypatch):
+        from core.config import _env_int
+
+        monkeypatch.setenv("EXTRACT_PROCESSES", "auto")
+        assert _env_int("EXTRACT_PROCESSES") == 0
+        monkeypatch.setenv("EXTRACT_PROCESSES", "2")
+        assert _env_int("EXTRACT_PROCESSES") == 2
+
     @pytest.mark.unit
     async def test_custom_strategy_with_selectors(self):
         """Test custom strategy with provided selectors."""
@@ -341,6 +437,26 @@ class TestSmartExtractor:
         if result:
             assert result.source == "custom"
 
+    @pytest.mark.unit
+    async def test_custom_extractor_built_once(self):
+        """Test that the custom extractor is reused across pages."""
+        html = """
+        <html><body>
+            <h1 class="title">Test Title</h1>
+            <div class="body">Article content that is long enough for validation.</div>
+        </body></html>
+        """
+        extractor = SmartExtractor(
+            strategies=["custom"],
+            custom_selectors={"title": "h1.title", "content": "div.body"},
+        )
+
+        with patch("core.extractors.CustomExtractor") as factory:
+            await extractor.extract(url="https://example.com/a", html=html)
+            await extractor.extract(url="https://example.com/b", html=html)
+
+        factory.assert_not_called()
+
     @pytest.mark.unit
     async def test_custom_strategy_without_selectors(self, sample_html_simple):
         """Test that custom strategy is skipped when no selectors provided."""
@@ -545,3 +661,85 @@ class TestExtractorRobustness:
         except (ValueError, Exception) as e:
             if "Content too short" not in str(e) and "Title too short" not in str(e):
                 pytest.fail(f"Unexpected error: {e}")
+
+    @pytest.mark.unit
+    def test_selector_text_skips_script_and_style(self):
+        """Test that script/style text is not included in extracted text."""
+        html = """
+        <html><body>
+            <h1>Title <script>var x = 1;</script>Here</h1>
+            <div class="content">
+                <style>p {}</style>
+                This is article content that is long enough to pass validation.
+            </div>
+        </body></html>
+        """
+        extractor = CustomExtractor(selectors={"title": "h1", "content": "div.content"})
+
+        result = extractor.extract(url="https://example.com/article", html=html)
+
+        assert result.title == "Title Here"
+        assert result.content.startswith("This is article content")
+
+    @pytest.mark.unit
+    def test_supports_text_and_attr_pseudo_elements(self):
+        """Test that ::text and ::attr() selectors return their values."""
+        html = """
+        <html><body>
+            <h1>Article Title</h1>
+            <div class="content">This is article content that is long enough to pass validation.</div>
+            <meta name="author" content="Jane Doe">
+        </body></html>
+        """
+        extractor = CustomExtractor(
+            selectors={
+                "title": "h1::text",
+                "content": "div.content",
+                "author": "meta[name=author]::attr(content)",
+            }
+        )
+
+        result = extractor.extract(url="https://example.com/article", html=html)
+
+        assert result.title == "Article Title"
+        assert result.author == "Jane Doe"
+
+    @pytest.mark.unit
+    def test_falls_back_to_soupsieve_only_selectors(self):
+        """Test that selectors lxml cannot parse still go through BeautifulSoup."""
+        html = """
+        <html><body>
+            <h1>Article Title</h1>
+            <div class="content">This is article content that is long enough to pass validation.</div>
+            <span>By Jane Doe</span>
+        </body></html>
+        """
+        extractor = CustomExtractor(
+            selectors={
+                "title": "h1",
+                "content": "div.content",
+                "author": "span:-soup-contains('By ')",
+            }
+        )
+
+        result = extractor.extract(url="https://example.com/article", html=html)
+
+        assert result.author == "By Jane Doe"
+
+    @pytest.mark.unit
+    def test_selectors_compiled_once(self):
+        """Test that CSS selectors are translated at construction, not per page."""
+        html = """
+        <html><body>
+            <h1>Article Title</h1>
+            <div class="content">This is article content that is long enough to pass validation.</div>
+        </body></html>
+        """
+        extractor = CustomExtractor(selectors={"title": "h1", "content": "div.content"})
+
+        with patch("core.extractors.css2xpath") as translate:
+            first = extractor.extract(url="https://example.com/a", html=html)
+            second = extractor.extract(url="https://example.com/b", html=html)
+
+        translate.assert_not_called()
+        assert first.title == second.title == "Article Title"
@@ -50,6 +50,13 @@ class TestRuntimeResolver:
         )
         assert s._resolve_field_extract_config()["title"]["css"] == "new"
 
+    def test_directives_resolved_once_per_spider(self):
+        s = _spider({"FIELDS": json.dumps({"title": {"css": "h1"}})})
+        first = s._get_field_directives()
+        s.custom_settings = {}
+        assert s._get_field_directives() is first
+        assert first == {"title": {"css": "h1"}}
+
 
 class TestSchemaCoverage:
     def _write_schema(self, tmp_path):
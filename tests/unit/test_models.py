@@ -4,6 +4,8 @@ Unit tests for SQLAlchemy schema constraints.
 Guards against regressions in the unique constraints that scope:
 - Spider names per project (``uq_spider_name_project``)
 - Scraped item URLs per spider (``uq_item_spider_url``)
+
+Also covers ``deserialize_spider_settings`` value decoding.
 """
 
 import pytest
@@ -12,7 +14,13 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from core.db import Base
-from core.models import Spider, ScrapedItem
+from core.models import (
+    Spider,
+    ScrapedItem,
+    SpiderRule,
+    SpiderSetting,
+    deserialize_spider_settings,
+)
 
 
 @pytest.fixture
@@ -91,3 +99,51 @@ class TestScrapedItemUniqueness:
         with pytest.raises(IntegrityError):
             session.commit()
         session.rollback()
+
+
+class TestDeserializeSpiderSettings:
+    @staticmethod
+    def _decode(value):
+        row = SpiderSetting(key="K", value=value)
+        return deserialize_spider_settings([row])["K"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ('{"a": 1}', {"a": 1}),
+            ('["custom"]', ["custom"]),
+            ("true", True),
+            ("null", None),
+            ("2.5", 2.5),
+            ("-3", -3),
+            ('"quoted"', "quoted"),
+            ("True", True),
+            ("FALSE", False),
+            ("links_only", "links_only"),
+            ("2024-01-01", "2024-01-01"),
+            ("", ""),
+        ],
+    )
+    def test_decodes_json_and_legacy_values(self, raw, expected):
+        assert self._decode(raw) == expected
+
+    @pytest.mark.unit
+    def test_invalid_json_falls_back_to_raw_string(self):
+        assert self._decode("{'a': 1}") == "{'a': 1}"
+
+
+class TestSpiderRuleOrdering:
+    @pytest.mark.unit
+    def test_rules_load_highest_priority_first(self, session):
+        """Spider.rules arrives priority-desc (insertion order breaks ties)."""
+        sp = _make_spider("ordered")
+        session.add(sp)
+        session.flush()
+        for prio, cb in [(0, "low"), (10, "high"), (5, "mid_a"), (5, "mid_b")]:
+            session.add(SpiderRule(spider_id=sp.id, priority=prio, callback=cb))
+        session.commit()
+        session.expire_all()
+
+        loaded = session.query(Spider).filter_by(name="ordered").one()
+        assert [r.callback for r in loaded.rules] == ["high", "mid_a", "mid_b", "low"]
@@ -18,7 +18,7 @@ from sqlalchemy.orm import sessionmaker
 import core.db as core_db
 from core.db import Base
 from core.models import Spider, ScrapedItem
-from pipelines import DatabasePipeline, _normalize_dt
+from pipelines import DatabasePipeline, ScrapaiPipeline, _normalize_dt
 
 
 class TestNormalizeDt:
@@ -48,6 +48,32 @@ class TestNormalizeDt:
         assert d.tzinfo == timezone.utc and d.hour == 11
 
 
+class TestScrapedAtStamp:
+    @pytest.mark.unit
+    def test_matches_isoformat_with_microseconds(self, monkeypatch):
+        pipe = ScrapaiPipeline()
+        for ns in (1_700_000_000_250_000_000, 1_700_000_000_000_000_000):
+            monkeypatch.setattr("pipelines.time.time_ns", lambda: ns)
+            expected = datetime.fromtimestamp(ns / 1e9).isoformat()
+            assert pipe.process_item({"url": "a"})["scraped_at"] == expected
+
+    @pytest.mark.unit
+    def test_prefix_formatted_once_per_second(self, monkeypatch):
+        pipe = ScrapaiPipeline()
+        monkeypatch.setattr("pipelines.time.time_ns", lambda: 1_700_000_000_250_000_000)
+        first = pipe.process_item({"url": "a"})["scraped_at"]
+        prefix = pipe._stamp
+        monkeypatch.setattr("pipelines.time.time_ns", lambda: 1_700_000_000_900_000_000)
+        second = pipe.process_item({"url": "b"})["scraped_at"]
+
+        assert pipe._stamp is prefix
+        assert first < second and first.endswith(".250000")
+
+        monkeypatch.setattr("pipelines.time.time_ns", lambda: 1_700_000_001_000_000_000)
+        pipe.process_item({"url": "c"})
+        assert pipe._stamp != prefix
+
+
 @pytest.fixture
 def pipeline_db(monkeypatch):
     """Patch core.db.SessionLocal to a fresh in-memory DB and return a session.
@@ -236,3 +262,56 @@ class TestPerRowQuarantineFallback:
         )
         assert len(dup_rows) == 1
         assert dup_rows[0].title == "orig"
+
+
+class TestInBatchDedup:
+    @pytest.mark.unit
+    def test_repeated_url_in_buffer_is_inserted_once(self, pipeline_db):
+        """A URL buffered twice (e.g. a dont_filter retry) lands as one row."""
+        inspect, _ = pipeline_db
+        (sid,) = _seed_spiders(inspect, "spider_one")
+
+        pipe = DatabasePipeline()
+        pipe.buffer = [
+            _item(sid, "https://example.com/a", title="first"),
+            _item(sid, "https://example.com/b"),
+            _item(sid, "https://example.com/a", title="retry"),
+        ]
+        pipe._flush(_FakeSpider())
+
+        rows = (
+            inspect.query(ScrapedItem)
+            .filter(ScrapedItem.url == "https://example.com/a")
+            .all()
+        )
+        assert len(rows) == 1
+        assert rows[0].title == "first"
+        assert pipe.buffer == []
+
+
+class TestCallbackItemSerialization:
+    @pytest.mark.unit
+    def test_datetimes_inside_nested_list_rows_are_serialized(self, pipeline_db):
+        """nested_list output (a list of dicts) may carry datetimes from
+        processors; they must be ISO strings before hitting the JSON column."""
+        inspect, _ = pipeline_db
+        (sid,) = _seed_spiders(inspect, "spider_one")
+
+        posted = datetime(2024, 2, 1, 9, 30, tzinfo=timezone.utc)
+        item = {
+            "spider_id": sid,
+            "url": "https://example.com/thread",
+            "_callback": "parse_thread",
+            "posted": posted,
+            "comments": [{"author": "a", "date": posted}],
+        }
+
+        pipe = DatabasePipeline()
+        pipe.buffer = [item]
+        pipe._flush(_FakeSpider())
+
+        row = inspect.query(ScrapedItem).one()
+        assert row.metadata_json["posted"] == posted.isoformat()
+        assert row.metadata_json["comments"] == [
+            {"author": "a", "date": posted.isoformat()}
+        ]
@@ -0,0 +1,58 @@
+"""SCHEDULER_PRIORITY_QUEUE is DownloaderAwarePriorityQueue, which can't resume
+a checkpoint saved by the old ScrapyPriorityQueue and refuses to start when
+CONCURRENT_REQUESTS_PER_IP is set. Both cases fall back to ScrapyPriorityQueue.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from scrapy.settings import Settings
+
+from cli.crawl import _legacy_queue_checkpoint
+from spiders.base import BaseDBSpiderMixin
+
+pytestmark = pytest.mark.unit
+
+
+def _write_queue_state(checkpoint, state):
+    qdir = checkpoint / "requests.queue"
+    qdir.mkdir(parents=True)
+    (qdir / "active.json").write_text(json.dumps(state))
+
+
+def test_checkpoint_from_old_queue_is_detected(tmp_path):
+    _write_queue_state(tmp_path, [0, -1])
+    assert _legacy_queue_checkpoint(tmp_path) is True
+
+
+def test_downloader_aware_checkpoint_is_not_legacy(tmp_path):
+    _write_queue_state(tmp_path, {"example.com": [0]})
+    assert _legacy_queue_checkpoint(tmp_path) is False
+
+
+def test_missing_or_empty_queue_state_is_not_legacy(tmp_path):
+    assert _legacy_queue_checkpoint(tmp_path) is False
+    _write_queue_state(tmp_path, [])
+    assert _legacy_queue_checkpoint(tmp_path) is False
+
+
+def _apply(custom_settings):
+    crawler = SimpleNamespace(
+        settings=Settings(
+            {"SCHEDULER_PRIORITY_QUEUE": "scrapy.pqueues.DownloaderAwarePriorityQueue"}
+        )
+    )
+    spider = SimpleNamespace(custom_settings=custom_settings)
+    BaseDBSpiderMixin._apply_cf_to_crawler(spider, crawler)
+    return crawler.settings["SCHEDULER_PRIORITY_QUEUE"]
+
+
+def test_per_ip_concurrency_falls_back_to_default_queue():
+    queue = _apply({"CONCURRENT_REQUESTS_PER_IP": 2})
+    assert queue == "scrapy.pqueues.ScrapyPriorityQueue"
+
+
+def test_downloader_aware_queue_kept_without_per_ip_concurrency():
+    queue = _apply({"CONCURRENT_REQUESTS": 8})
+    assert queue == "scrapy.pqueues.DownloaderAwarePriorityQueue"
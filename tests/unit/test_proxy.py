@@ -150,3 +150,46 @@ class TestChain:
     def test_static_chain(self, monkeypatch):
         _set_dc(monkeypatch)
         assert proxy.chain("static") == [DC]
+
+
+class TestMiddlewareLazyResolution:
+    def test_init_does_not_resolve_proxy(self, monkeypatch):
+        from middlewares import SmartProxyMiddleware
+
+        calls = []
+        monkeypatch.setattr(proxy, "select", lambda mode: calls.append(mode))
+        SmartProxyMiddleware(settings=None, crawler=None)
+        assert calls == []
+
+    def test_resolves_on_first_use(self, monkeypatch):
+        from middlewares import SmartProxyMiddleware
+
+        mw = SmartProxyMiddleware(settings=None, crawler=None)
+        _set_dc(monkeypatch)
+        assert mw.proxy_available is True
+        assert (mw.proxy_url, mw.active_proxy_type) == (DC, "datacenter")
+
+    def test_spider_opened_reports_direct_when_no_proxy(self, caplog):
+        from types import SimpleNamespace
+        from middlewares import SmartProxyMiddleware
+
+        mw = SmartProxyMiddleware(settings=None, crawler=None)
+        with caplog.at_level("INFO", logger="middlewares"):
+            mw.spider_opened(SimpleNamespace(name="s"))
+        assert "Direct connections only" in caplog.text
+        assert "Smart proxy mode" not in caplog.text
+
+    def test_spider_opened_reports_proxy_without_selecting_it(
+        self, monkeypatch, caplog
+    ):
+        from types import SimpleNamespace
+        from middlewares import SmartProxyMiddleware
+
+        _set_res(monkeypatch)
+        calls = []
+        monkeypatch.setattr(proxy, "select", lambda mode: calls.append(mode))
+        mw = SmartProxyMiddleware(settings=None, crawler=None)
+        with caplog.at_level("INFO", logger="middlewares"):
+            mw.spider_opened(SimpleNamespace(name="s"))
+        assert "Smart proxy mode enabled" in caplog.text
+        assert calls == []
@@ -0,0 +1,127 @@
+"""Tests for RateLimitBackoffMiddleware (per-slot backoff on HTTP 429)."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from scrapy import Request
+from scrapy.http import Response
+from scrapy.extensions.throttle import AutoThrottle
+from scrapy.settings import Settings
+
+from middlewares import RateLimitBackoffMiddleware, _parse_retry_after
+
+pytestmark = pytest.mark.unit
+
+SLOT = "example.com"
+
+
+def _middleware(delay=0.0, **settings):
+    slot = SimpleNamespace(delay=delay)
+    crawler = SimpleNamespace(
+        settings=Settings(settings),
+        engine=SimpleNamespace(downloader=SimpleNamespace(slots={SLOT: slot})),
+        stats=MagicMock(),
+    )
+    return RateLimitBackoffMiddleware.from_crawler(crawler), slot
+
+
+def _call(mw, status, headers=None, throttle=None):
+    req = Request(
+        "https://example.com/a", meta={"download_slot": SLOT, "download_latency": 0.2}
+    )
+    resp = Response(req.url, status=status, headers=headers or {}, request=req)
+    if throttle is not None:
+        # The downloader sends response_downloaded before the downloader
+        # middlewares' process_response runs.
+        throttle._response_downloaded(resp, req, None)
+    return mw.process_response(req, resp), resp
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("middlewares.time.monotonic", lambda: now[0])
+    return now
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert _parse_retry_after(b"30") == 30.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=120)
+        assert 100 < _parse_retry_after(format_datetime(when, usegmt=True)) <= 120
+
+    @pytest.mark.parametrize("value", [None, b"", b"soon"])
+    def test_missing_or_garbage(self, value):
+        assert _parse_retry_after(value) is None
+
+
+class TestBackoff:
+    def test_429_starts_from_start_delay_and_doubles(self):
+        mw, slot = _middleware(AUTOTHROTTLE_START_DELAY=2)
+        result, resp = _call(mw, 429)
+        assert result is resp
+        assert slot.delay == 2
+        _call(mw, 429)
+        assert slot.delay == 4
+        mw.crawler.stats.inc_value.assert_called_with("ratelimit/backoff")
+
+    def test_retry_after_wins_and_is_capped(self):
+        mw, slot = _middleware(delay=1.0, RATELIMIT_MAX_DELAY=60)
+        _call(mw, 429, {"Retry-After": "45"})
+        assert slot.delay == 45
+        _call(mw, 429, {"Retry-After": "3600"})
+        assert slot.delay == 60
+
+    def test_recovers_on_200_without_autothrottle(self, clock):
+        mw, slot = _middleware(delay=8.0, AUTOTHROTTLE_ENABLED=False, DOWNLOAD_DELAY=1)
+        _call(mw, 429)
+        assert slot.delay == 16
+        _call(mw, 200)
+        assert slot.delay == 16  # not before the deadline
+        for _ in range(3):
+            clock[0] += 60
+            _call(mw, 200)
+        assert slot.delay == 2
+        clock[0] += 60
+        _call(mw, 200)
+        assert slot.delay == 1
+        assert SLOT not in mw.backed_off
+
+    def test_holds_delay_until_deadline_with_autothrottle(self, clock):
+        mw, slot = _middleware(delay=4.0, AUTOTHROTTLE_ENABLED=True)
+        _call(mw, 429)
+        slot.delay = 0.5  # what AutoThrottle would set on the next response
+        _call(mw, 200)
+        assert slot.delay == 8
+
+    def test_backoff_survives_real_autothrottle(self, clock):
+        """AutoThrottle clamps to AUTOTHROTTLE_MAX_DELAY (10s in settings.py)
+        on every response; the 429 backoff must outlast it until the deadline."""
+        settings = Settings()
+        settings.setmodule("settings", priority="project")
+        mw, slot = _middleware(delay=1.0)
+        mw.crawler.settings = settings
+        mw = RateLimitBackoffMiddleware.from_crawler(mw.crawler)
+        mw.crawler.signals = MagicMock()
+        throttle = AutoThrottle.from_crawler(mw.crawler)
+        throttle._spider_opened(None)
+
+        _call(mw, 429, {"Retry-After": "45"}, throttle=throttle)
+        assert slot.delay == 45
+        clock[0] += 30
+        _call(mw, 200, throttle=throttle)
+        assert slot.delay == 45
+
+        clock[0] += 20  # past the deadline: halves, AutoThrottle can't undercut
+        _call(mw, 200, throttle=throttle)
+        assert slot.delay == 22.5
+
+    def test_ignores_200_on_untouched_slot(self):
+        mw, slot = _middleware(delay=5.0, AUTOTHROTTLE_ENABLED=False)
+        _call(mw, 200)
+        assert slot.delay == 5.0
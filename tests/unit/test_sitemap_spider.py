@@ -120,6 +120,21 @@ class TestSitemapRelativeLocResolution:
         assert out[0]["loc"] == "https://bbc.co.uk/media/blog/post-1"
         assert out[2]["loc"] == "https://cdn.bbc.co.uk/post-3"
 
+    @pytest.mark.unit
+    @patch("spiders.sitemap_spider.get_db")
+    def test_entries_logged_only_at_debug(self, mock_get_db, caplog):
+        _patch_get_db(mock_get_db, _make_active_spider_record("bbc_co_uk"))
+        spider = SitemapDatabaseSpider(spider_name="bbc_co_uk")
+        entries = [{"loc": "https://bbc.co.uk/a"}]
+
+        with caplog.at_level("INFO", logger="spiders.sitemap_spider"):
+            assert len(list(spider.sitemap_filter([dict(e) for e in entries]))) == 1
+        assert "Sitemap entry" not in caplog.text
+
+        with caplog.at_level("DEBUG", logger="spiders.sitemap_spider"):
+            list(spider.sitemap_filter([dict(e) for e in entries]))
+        assert "Sitemap entry: https://bbc.co.uk/a" in caplog.text
+
 
 class TestSitemapDenyPatterns:
     """Sitemap spiders must honor deny_patterns (item #2)."""
@@ -219,6 +234,62 @@ class TestSitemapDenyPatterns:
 
         assert out == ["https://bbc.co.uk/posts/keep"]
 
+    @pytest.mark.unit
+    @patch("spiders.sitemap_spider.get_db")
+    def test_deny_patterns_combined_into_one_regex(self, mock_get_db):
+        """Deny patterns from every rule are folded into one alternation."""
+        rules = [
+            _make_rule(allow=["/article/.*"], deny=[r"\.pdf$", r"/tag/"]),
+            _make_rule(deny=[r"\?page=\d+$"]),
+        ]
+        _patch_get_db(mock_get_db, _make_active_spider_record("bbc_co_uk", rules))
+        spider = SitemapDatabaseSpider(spider_name="bbc_co_uk")
+
+        assert len(spider._deny_res) == 1
+        entries = [
+            {"loc": "https://bbc.co.uk/article/1"},
+            {"loc": "https://bbc.co.uk/article/doc.pdf"},
+            {"loc": "https://bbc.co.uk/tag/politics"},
+            {"loc": "https://bbc.co.uk/article/list?page=3"},
+        ]
+        out = [e["loc"] for e in spider.sitemap_filter(entries)]
+        assert out == ["https://bbc.co.uk/article/1"]
+
+    @pytest.mark.unit
+    @patch("spiders.sitemap_spider.get_db")
+    def test_backreference_deny_patterns_stay_separate(self, mock_get_db):
+        """Combining would renumber groups, so backreferences keep the list."""
+        rule = _make_rule(deny=[r"/(\d+)/\1$", r"\.pdf$"])
+        _patch_get_db(mock_get_db, _make_active_spider_record("bbc_co_uk", [rule]))
+        spider = SitemapDatabaseSpider(spider_name="bbc_co_uk")
+
+        assert len(spider._deny_res) == 2
+        entries = [
+            {"loc": "https://bbc.co.uk/7/7"},
+            {"loc": "https://bbc.co.uk/7/8"},
+        ]
+        out = [e["loc"] for e in spider.sitemap_filter(entries)]
+        assert out == ["https://bbc.co.uk/7/8"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "pattern", [r"(?i)/print/", r"(?i:/print/)", r"(/print)?(?(1)/|x)"]
+    )
+    @patch("spiders.sitemap_spider.get_db")
+    def test_inline_flag_deny_patterns_stay_separate(self, mock_get_db, pattern):
+        """An inline flag must not leak into the other deny patterns."""
+        rule = _make_rule(deny=[pattern, r"\.pdf$"])
+        _patch_get_db(mock_get_db, _make_active_spider_record("bbc_co_uk", [rule]))
+        spider = SitemapDatabaseSpider(spider_name="bbc_co_uk")
+
+        assert len(spider._deny_res) == 2
+        entries = [
+            {"loc": "https://bbc.co.uk/print/1"},
+            {"loc": "https://bbc.co.uk/doc.PDF"},
+        ]
+        out = [e["loc"] for e in spider.sitemap_filter(entries)]
+        assert out == ["https://bbc.co.uk/doc.PDF"]
+
 
 class TestDatabaseSpiderNameResolution:
     """DatabaseSpider should also override class-level name with spider_name."""
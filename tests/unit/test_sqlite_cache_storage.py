@@ -0,0 +1,80 @@
+"""Tests for the SQLite HTTP cache storage backend."""
+
+from types import SimpleNamespace
+
+import pytest
+from scrapy import Request
+from scrapy.http import HtmlResponse
+from scrapy.settings import Settings
+from scrapy.utils.request import RequestFingerprinter
+
+from handlers.sqlite_cache_storage import SqliteCacheStorage
+
+pytestmark = pytest.mark.unit
+
+
+def _spider():
+    return SimpleNamespace(
+        name="cache_test",
+        crawler=SimpleNamespace(request_fingerprinter=RequestFingerprinter()),
+    )
+
+
+def _storage(tmp_path, expiration=0):
+    return SqliteCacheStorage(
+        Settings(
+            {"HTTPCACHE_DIR": str(tmp_path), "HTTPCACHE_EXPIRATION_SECS": expiration}
+        )
+    )
+
+
+def test_round_trip(tmp_path):
+    spider = _spider()
+    storage = _storage(tmp_path)
+    storage.open_spider(spider)
+
+    request = Request("https://example.com/a")
+    assert storage.retrieve_response(spider, request) is None
+
+    response = HtmlResponse(
+        "https://example.com/a",
+        status=200,
+        headers={"Content-Type": "text/html; charset=utf-8"},
+        body=b"<html><title>A</title></html>",
+    )
+    storage.store_response(spider, request, response)
+    cached = storage.retrieve_response(spider, Request("https://example.com/a"))
+    storage.close_spider(spider)
+
+    assert isinstance(cached, HtmlResponse)
+    assert cached.body == response.body
+    assert cached.status == 200
+    assert cached.headers["Content-Type"] == b"text/html; charset=utf-8"
+    assert (tmp_path / "cache_test.sqlite").exists()
+
+
+def test_persists_across_runs_and_expires(tmp_path, monkeypatch):
+    spider = _spider()
+    request = Request("https://example.com/b")
+    response = HtmlResponse("https://example.com/b", body=b"<p>b</p>")
+
+    monkeypatch.setattr("handlers.sqlite_cache_storage.time", lambda: 1000.0)
+    first = _storage(tmp_path, expiration=60)
+    first.open_spider(spider)
+    first.store_response(spider, request, response)
+    first.close_spider(spider)
+
+    second = _storage(tmp_path, expiration=60)
+    second.open_spider(spider)
+    assert second.retrieve_response(spider, request).body == b"<p>b</p>"
+
+    monkeypatch.setattr("handlers.sqlite_cache_storage.time", lambda: 1100.0)
+    assert second.retrieve_response(spider, request) is None
+    second.close_spider(spider)
+
+    # Expired rows are pruned when the next run opens the cache.
+    third = _storage(tmp_path, expiration=60)
+    third.open_spider(spider)
+    count = third.db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+    third.close_spider(spider)
+    assert count == 0